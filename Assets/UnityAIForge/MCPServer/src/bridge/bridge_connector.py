@@ -13,6 +13,8 @@ from logger import logger
 
 
 class BridgeConnector:
+    __slots__ = ("_task", "_stop_event", "_intentional_close")
+
     def __init__(self) -> None:
         self._task: asyncio.Task[None] | None = None
         self._stop_event = asyncio.Event()
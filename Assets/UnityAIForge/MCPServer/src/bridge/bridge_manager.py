@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import contextlib
+import itertools
 import json
+import logging
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 from uuid import uuid4
 
 from websockets.asyncio.client import ClientConnection
-from websockets.exceptions import ConnectionClosed
+from websockets.exceptions import ConnectionClosed, ConnectionClosedOK
 from websockets.protocol import State as ConnectionState
 
 from bridge.messages import (
@@ -23,22 +26,30 @@ from bridge.messages import (
     ClientInfo,
     ServerInfoMessage,
     ServerMessage,
+    ServerPingMessage,
     UnityContextPayload,
 )
 from logger import logger
 from utils.client_detector import get_client_info
+from utils.json_utils import as_json_bytes, parse_json
 
 MAX_PENDING_COMMANDS = 100
+# How often pending command deadlines are checked.
+COMMAND_TIMEOUT_SWEEP_SECONDS = 0.1
+# Unity's MiniJson serializes heartbeats as exactly
+# {"type":"heartbeat","timestamp":<ms>}, so they can be read off the raw frame.
+_HEARTBEAT_PREFIX = b'{"type":"heartbeat","timestamp":'
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingCommand:
     tool_name: str
     future: asyncio.Future[Any]
-    timeout_handle: asyncio.TimerHandle
+    deadline: float  # loop.time() after which the command times out
+    timeout_ms: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CompilationWaiter:
     future: asyncio.Future[Any]
     timeout_handle: asyncio.TimerHandle
@@ -53,27 +64,59 @@ class BridgeManager:
         self._last_heartbeat_at: int | None = None
         self._context: UnityContextPayload | None = None
         self._pending_commands: dict[str, PendingCommand] = {}
+        # Command ids are a per-process random prefix plus a counter.  The
+        # prefix keeps ids from colliding with commands Unity persisted
+        # across a domain reload on behalf of an earlier server process.
+        self._command_id_prefix = uuid4().hex[:8]
+        self._command_counter = itertools.count(1)
         self._compilation_waiters: list[CompilationWaiter] = []
+        # Woken by compilation:started or a disconnect; see wait_for_compilation_start.
+        self._compilation_start_waiters: list[asyncio.Future[None]] = []
         self._is_compiling: bool = False
         self._compilation_start_time: float | None = None
-        self._listeners: dict[str, list[Callable[..., None]]] = {
-            "connected": [],
-            "disconnected": [],
-            "contextUpdated": [],
+        # Listener tuples are replaced, never mutated, so _emit can iterate
+        # them without taking a copy.
+        self._listeners: dict[str, tuple[Callable[..., None], ...]] = {
+            "connected": (),
+            "disconnected": (),
+            "contextUpdated": (),
         }
         self._receive_task: asyncio.Task[None] | None = None
-        self._send_lock = asyncio.Lock()
+        self._timeout_task: asyncio.Task[None] | None = None
+        self._ping_message: ServerPingMessage = {"type": "ping", "timestamp": 0}
+        # At most one frame is written at a time.  Uncontended sends go out
+        # inline; frames that arrive while one is in flight are queued and
+        # written in order by a single writer task, so no lock is needed.
+        self._writer_busy = False
+        self._send_queue: collections.deque[
+            tuple[ClientConnection, bytes, asyncio.Future[None]]
+        ] = collections.deque()
+        self._writer_task: asyncio.Task[None] | None = None
+        # Message type -> handler.  Sync and async handlers are kept apart so
+        # dispatch never has to inspect whether the result needs awaiting.
+        self._message_handlers: dict[str, Callable[[Any], None]] = {
+            "heartbeat": self._handle_heartbeat,
+            "context:update": self._handle_context_update,
+            "command:result": self._handle_command_result,
+            "compilation:started": self._handle_compilation_started,
+            "compilation:progress": self._handle_compilation_progress,
+            "compilation:complete": self._handle_compilation_complete,
+            "bridge:restarted": self._handle_bridge_restarted,
+        }
+        self._async_message_handlers: dict[str, Callable[[Any], Awaitable[None]]] = {
+            "hello": self._handle_hello,
+        }
 
     async def attach(self, socket: ClientConnection) -> None:
         await self._teardown_socket()
         self._socket = socket
-        self._last_heartbeat_at = int(time.time() * 1000)
+        self._last_heartbeat_at = _now_ms()
         self._receive_task = asyncio.create_task(self._receive_loop(socket))
 
     def on(self, event: str, callback: Callable[..., None]) -> None:
         if event not in self._listeners:
             raise ValueError(f"Unsupported event: {event}")
-        self._listeners[event].append(callback)
+        self._listeners[event] += (callback,)
 
     def is_connected(self) -> bool:
         return _is_socket_open(self._socket)
@@ -188,6 +231,40 @@ class BridgeManager:
             return await future
         finally:
             timeout_handle.cancel()
+            if future.cancelled():
+                # The caller gave up; do not leave a dead waiter behind.
+                self._compilation_waiters[:] = [
+                    w for w in self._compilation_waiters if w.future is not future
+                ]
+
+    async def wait_for_compilation_start(self, timeout: float) -> bool:
+        """Wait up to *timeout* seconds for a sign that compilation has started.
+
+        Returns as soon as Unity sends ``compilation:started`` or the bridge
+        disconnects (a domain reload drops the connection), so callers no
+        longer have to sleep out a fixed poll interval.
+
+        Returns:
+            True if compilation started or the bridge is disconnected.
+        """
+        if self._is_compiling or not self.is_connected():
+            return True
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._compilation_start_waiters.append(future)
+        try:
+            await asyncio.wait((future,), timeout=timeout)
+        finally:
+            if not future.done():
+                future.cancel()
+                self._compilation_start_waiters.remove(future)
+        return self._is_compiling or not self.is_connected()
+
+    def _wake_compilation_start_waiters(self) -> None:
+        waiters, self._compilation_start_waiters = self._compilation_start_waiters, []
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
 
     async def send_command(
         self,
@@ -204,22 +281,16 @@ class BridgeManager:
                 "Unity bridge may be unresponsive."
             )
 
-        command_id = uuid4().hex
+        command_id = f"{self._command_id_prefix}-{next(self._command_counter):x}"
         future: asyncio.Future[Any] = loop.create_future()
-
-        def on_timeout() -> None:
-            pending = self._pending_commands.pop(command_id, None)
-            if pending and not pending.future.done():
-                pending.future.set_exception(
-                    TimeoutError(f'Bridge command "{tool_name}" timed out after {timeout_ms}ms')
-                )
-
-        timeout_handle = loop.call_later(timeout_ms / 1000, on_timeout)
         self._pending_commands[command_id] = PendingCommand(
             tool_name=tool_name,
             future=future,
-            timeout_handle=timeout_handle,
+            deadline=loop.time() + timeout_ms / 1000,
+            timeout_ms=timeout_ms,
         )
+        if self._timeout_task is None:
+            self._timeout_task = asyncio.create_task(self._expire_pending_commands())
 
         message: ServerMessage = {
             "type": "command:execute",
@@ -231,36 +302,120 @@ class BridgeManager:
         await self._send_json(socket, message)
         return await future
 
+    async def _expire_pending_commands(self) -> None:
+        """Fail pending commands whose deadline has passed.
+
+        A single task sweeps all in-flight commands instead of arming a timer
+        per command.  It exits once nothing is pending and is restarted by the
+        next ``send_command``.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending_commands:
+                await asyncio.sleep(COMMAND_TIMEOUT_SWEEP_SECONDS)
+                now = loop.time()
+                expired = [
+                    command_id
+                    for command_id, pending in self._pending_commands.items()
+                    if pending.deadline <= now or pending.future.done()
+                ]
+                for command_id in expired:
+                    pending = self._pending_commands.pop(command_id)
+                    if not pending.future.done():
+                        pending.future.set_exception(
+                            TimeoutError(
+                                f'Bridge command "{pending.tool_name}" timed out '
+                                f"after {pending.timeout_ms}ms"
+                            )
+                        )
+        finally:
+            self._timeout_task = None
+
     async def send_ping(self) -> None:
         socket = self._socket
         if socket is None or not _is_socket_open(socket):
             return
 
-        message: ServerMessage = {
-            "type": "ping",
-            "timestamp": int(time.time() * 1000),
-        }
-        await self._send_json(socket, message)
+        # _send_json serializes before its first await, so the shared
+        # message can be updated in place for every ping.
+        self._ping_message["timestamp"] = _now_ms()
+        await self._send_json(socket, self._ping_message)
 
     async def _send_json(self, socket: ClientConnection, message: ServerMessage) -> None:
-        async with self._send_lock:
-            try:
-                await socket.send(json.dumps(message))
-            except ConnectionClosed:
-                await self._handle_disconnect(socket)
-                raise RuntimeError("Unity bridge is not connected") from None
+        data = as_json_bytes(message)
+        if self._writer_busy:
+            # Another frame is in flight: queue behind it and let the writer
+            # task send this one in order.
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._send_queue.append((socket, data, future))
+            await future
+            return
+
+        # Uncontended: send inline without a queue round-trip.
+        self._writer_busy = True
+        try:
+            await self._write_frame(socket, data)
+        finally:
+            if self._send_queue:
+                self._writer_task = asyncio.create_task(self._writer_loop())
+            else:
+                self._writer_busy = False
+
+    async def _write_frame(self, socket: ClientConnection, data: bytes) -> None:
+        try:
+            await socket.send(data, text=True)
+        except ConnectionClosed:
+            await self._handle_disconnect(socket)
+            raise RuntimeError("Unity bridge is not connected") from None
+
+    async def _writer_loop(self) -> None:
+        """Write queued frames in order until the send queue is empty.
+
+        Frames queued while a write is in flight are picked up by the same
+        task, so bursts of commands are drained in one pass.  Each frame is
+        still sent as its own WebSocket message because Unity expects one
+        JSON document per message.
+        """
+        queue = self._send_queue
+        try:
+            while queue:
+                socket, data, future = queue.popleft()
+                if future.done():
+                    # Sender was cancelled before its turn came up.
+                    continue
+                try:
+                    await self._write_frame(socket, data)
+                except Exception as exc:
+                    if not future.done():
+                        future.set_exception(exc)
+                else:
+                    if not future.done():
+                        future.set_result(None)
+        finally:
+            self._writer_task = None
+            self._writer_busy = False
 
     async def _receive_loop(self, socket: ClientConnection) -> None:
         logger.info("Unity bridge socket listener started")
         try:
-            async for raw in socket:
+            while True:
+                # Unity sends text frames; take them as raw bytes so the JSON
+                # parser reads the UTF-8 payload without an intermediate str.
+                raw = await socket.recv(decode=False)
+                if raw.startswith(_HEARTBEAT_PREFIX):
+                    timestamp = raw[len(_HEARTBEAT_PREFIX) : -1]
+                    if raw.endswith(b"}") and timestamp.isdigit():
+                        self._last_heartbeat_at = int(timestamp)
+                        continue
                 try:
-                    payload = json.loads(raw)
+                    payload = parse_json(raw)
                 except json.JSONDecodeError as exc:
                     logger.error("Failed to decode bridge message: %s", exc)
                     continue
 
                 await self._handle_message(payload)
+        except ConnectionClosedOK:
+            pass
         except ConnectionClosed as exc:
             logger.warning(
                 "Unity bridge connection closed (code=%s, reason=%s)",
@@ -274,33 +429,25 @@ class BridgeManager:
 
     async def _handle_message(self, message: BridgeNotificationMessage) -> None:
         message_type = message.get("type")
-        if message_type == "hello":
-            await self._handle_hello(message)  # type: ignore[arg-type]
-        elif message_type == "heartbeat":
-            self._handle_heartbeat(message)  # type: ignore[arg-type]
-        elif message_type == "context:update":
-            self._handle_context_update(message)  # type: ignore[arg-type]
-        elif message_type == "command:result":
-            self._handle_command_result(message)  # type: ignore[arg-type]
-        elif message_type == "compilation:started":
-            self._handle_compilation_started(message)
-        elif message_type == "compilation:progress":
-            self._handle_compilation_progress(message)
-        elif message_type == "compilation:complete":
-            self._handle_compilation_complete(message)
-        elif message_type == "bridge:restarted":
-            self._handle_bridge_restarted(message)  # type: ignore[arg-type]
-        else:
-            logger.warning("Received unsupported bridge message: %s", message_type)
+        handler = self._message_handlers.get(message_type)  # type: ignore[arg-type]
+        if handler is not None:
+            handler(message)
+            return
+        async_handler = self._async_message_handlers.get(message_type)  # type: ignore[arg-type]
+        if async_handler is not None:
+            await async_handler(message)
+            return
+        logger.warning("Received unsupported bridge message: %s", message_type)
 
     async def _handle_hello(self, message: BridgeHelloMessage) -> None:
         self._session_id = message.get("sessionId")
-        logger.info(
-            "Unity bridge connected (session=%s unityVersion=%s project=%s)",
-            self._session_id,
-            message.get("unityVersion"),
-            message.get("projectName"),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Unity bridge connected (session=%s unityVersion=%s project=%s)",
+                self._session_id,
+                message.get("unityVersion"),
+                message.get("projectName"),
+            )
 
         # Send client info to Unity
         await self._send_client_info()
@@ -328,8 +475,6 @@ class BridgeManager:
             logger.warning("Received result for unknown command: %s", command_id)
             return
 
-        pending.timeout_handle.cancel()
-
         if message.get("ok"):
             pending.future.set_result(message.get("result"))
         else:
@@ -346,6 +491,7 @@ class BridgeManager:
         self._is_compiling = True
         self._compilation_start_time = time.time()
         logger.info("Compilation started at timestamp %d", timestamp)
+        self._wake_compilation_start_waiters()
 
     def _handle_compilation_progress(self, message: dict[str, Any]) -> None:
         """Handle compilation:progress message from Unity bridge.
@@ -354,13 +500,15 @@ class BridgeManager:
         but enforces an absolute deadline of 2x the original timeout_seconds
         to prevent infinite waits if progress messages keep arriving.
         """
-        elapsed = message.get("elapsedSeconds", 0)
-        status = message.get("status", "compiling")
-        logger.debug(
-            "Compilation progress: status=%s, elapsed=%ds",
-            status,
-            elapsed,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Compilation progress: status=%s, elapsed=%ds",
+                message.get("status", "compiling"),
+                message.get("elapsedSeconds", 0),
+            )
+
+        if not self._compilation_waiters:
+            return
 
         # Extend timeout for active compilation waiters, but cap at absolute deadline
         loop = asyncio.get_running_loop()
@@ -384,50 +532,49 @@ class BridgeManager:
                 waiter.timeout_handle.cancel()
                 # Use the lesser of original timeout and remaining absolute time
                 new_delay = min(waiter.timeout_seconds, remaining)
-
-                def make_timeout_callback(w: CompilationWaiter) -> Callable[[], None]:
-                    def on_timeout() -> None:
-                        if not w.future.done():
-                            self._compilation_waiters[:] = [
-                                x for x in self._compilation_waiters if x.future is not w.future
-                            ]
-                            total_elapsed = time.time() - w.created_at
-                            w.future.set_exception(
-                                TimeoutError(
-                                    f"Compilation did not complete within {total_elapsed:.0f}s "
-                                    f"(timeout={w.timeout_seconds}s, max={w.timeout_seconds * 2}s). "
-                                    f"Check Unity Editor console for compilation status."
-                                )
-                            )
-
-                    return on_timeout
-
-                waiter.timeout_handle = loop.call_later(new_delay, make_timeout_callback(waiter))
+                waiter.timeout_handle = loop.call_later(
+                    new_delay, self._expire_extended_compilation_waiter, waiter
+                )
                 logger.debug(
                     "Extended compilation timeout for waiter (delay=%.1fs, remaining_absolute=%.1fs)",
                     new_delay,
                     remaining,
                 )
 
+    def _expire_extended_compilation_waiter(self, waiter: CompilationWaiter) -> None:
+        """Fail a compilation waiter whose progress-extended timeout elapsed."""
+        if waiter.future.done():
+            return
+        self._compilation_waiters[:] = [
+            w for w in self._compilation_waiters if w.future is not waiter.future
+        ]
+        total_elapsed = time.time() - waiter.created_at
+        waiter.future.set_exception(
+            TimeoutError(
+                f"Compilation did not complete within {total_elapsed:.0f}s "
+                f"(timeout={waiter.timeout_seconds}s, max={waiter.timeout_seconds * 2}s). "
+                f"Check Unity Editor console for compilation status."
+            )
+        )
+
     def _handle_compilation_complete(self, message: dict[str, Any]) -> None:
         """Handle compilation:complete message from Unity bridge."""
         result = message.get("result", {})
-        elapsed = result.get("elapsedSeconds", 0)
 
         # Reset compilation state
         self._is_compiling = False
         self._compilation_start_time = None
 
-        logger.info(
-            "Compilation complete: success=%s, errors=%s, elapsed=%ds",
-            result.get("success"),
-            result.get("errorCount", 0),
-            elapsed,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Compilation complete: success=%s, errors=%s, elapsed=%ds",
+                result.get("success"),
+                result.get("errorCount", 0),
+                result.get("elapsedSeconds", 0),
+            )
 
         # Resolve all pending compilation waiters
-        waiters = self._compilation_waiters[:]
-        self._compilation_waiters.clear()
+        waiters, self._compilation_waiters = self._compilation_waiters, []
 
         for waiter in waiters:
             waiter.timeout_handle.cancel()
@@ -467,8 +614,7 @@ class BridgeManager:
                 "message": f"Unity bridge restarted due to: {reason}",
             }
 
-            waiters = self._compilation_waiters[:]
-            self._compilation_waiters.clear()
+            waiters, self._compilation_waiters = self._compilation_waiters, []
 
             for waiter in waiters:
                 waiter.timeout_handle.cancel()
@@ -476,7 +622,7 @@ class BridgeManager:
                     waiter.future.set_result(result)
 
     def _emit(self, event: str, *args) -> None:
-        for callback in list(self._listeners.get(event, [])):
+        for callback in self._listeners.get(event, ()):
             try:
                 callback(*args)
             except Exception:  # pragma: no cover - defensive
@@ -532,6 +678,7 @@ class BridgeManager:
         self._last_heartbeat_at = None
         self._emit("disconnected")
         self._flush_pending_commands(RuntimeError("Bridge disconnected"))
+        self._wake_compilation_start_waiters()
 
         # Note: We intentionally do NOT clear _compilation_waiters here.
         # They will be resolved when:
@@ -540,11 +687,10 @@ class BridgeManager:
         # 3. Timeout occurs
 
     def _flush_pending_commands(self, error: Exception) -> None:
-        for command_id, pending in list(self._pending_commands.items()):
-            pending.timeout_handle.cancel()
+        pending_commands, self._pending_commands = self._pending_commands, {}
+        for pending in pending_commands.values():
             if not pending.future.done():
                 pending.future.set_exception(error)
-            self._pending_commands.pop(command_id, None)
 
     async def _wait_for_reconnection(self, timeout: float) -> bool:
         """Poll ``is_connected`` until the bridge reconnects or *timeout* elapses.
@@ -597,5 +743,10 @@ class BridgeManager:
 bridge_manager = BridgeManager()
 
 
+def _now_ms() -> int:
+    """Return the current wall-clock time in integer epoch milliseconds."""
+    return time.time_ns() // 1_000_000
+
+
 def _is_socket_open(socket: ClientConnection | None) -> bool:
     return bool(socket and socket.state is not ConnectionState.CLOSED)
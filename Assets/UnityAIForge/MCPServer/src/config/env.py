@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
@@ -17,11 +17,27 @@ _config_logger = logging.getLogger(__name__)
 LogLevel = Literal["fatal", "error", "warn", "info", "debug", "trace", "silent"]
 NotificationMode = Literal["compilation", "all", "none"]
 
+_TRUTHY_VALUES = frozenset({"1", "true", "yes", "on"})
+_NOTIFICATION_MODES: dict[str, NotificationMode] = {
+    "compilation": "compilation",
+    "all": "all",
+    "none": "none",
+}
+_LOG_LEVELS: dict[str, LogLevel] = {
+    "fatal": "fatal",
+    "error": "error",
+    "warn": "warn",
+    "info": "info",
+    "debug": "debug",
+    "trace": "trace",
+    "silent": "silent",
+}
+
 
 def _parse_bool(value: str | None, default: bool) -> bool:
     if value is None:
         return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    return value.strip().lower() in _TRUTHY_VALUES
 
 
 def _parse_int(
@@ -60,29 +76,15 @@ def _default_editor_log() -> Path:
 
 def _parse_notification_mode(value: str | None) -> NotificationMode:
     normalized = (value or "").strip().lower()
-    allowed: dict[str, NotificationMode] = {
-        "compilation": "compilation",
-        "all": "all",
-        "none": "none",
-    }
-    return allowed.get(normalized, "compilation")
+    return _NOTIFICATION_MODES.get(normalized, "compilation")
 
 
 def _parse_log_level(value: str | None) -> LogLevel:
     normalized = (value or "").strip().lower()
-    allowed: dict[str, LogLevel] = {
-        "fatal": "fatal",
-        "error": "error",
-        "warn": "warn",
-        "info": "info",
-        "debug": "debug",
-        "trace": "trace",
-        "silent": "silent",
-    }
-    return allowed.get(normalized, "info")
-
-
-@dataclass(frozen=True)
+    return _LOG_LEVELS.get(normalized, "info")
+
+
+@dataclass(frozen=True, slots=True)
 class ServerEnv:
     port: int
     host: str
@@ -95,6 +97,16 @@ class ServerEnv:
     bridge_reconnect_ms: int
     bridge_token: str | None
     notification_mode: NotificationMode
+    # Log-safe form of bridge_token, derived once in __post_init__
+    bridge_token_masked: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        token = self.bridge_token
+        if token and len(token) > 4:
+            masked = "****" + token[-4:]
+        else:
+            masked = "set" if token else "not set"
+        object.__setattr__(self, "bridge_token_masked", masked)
 
 
 # CLI argument overrides storage
@@ -191,13 +203,15 @@ def _create_env() -> ServerEnv:
     3. Environment variables (MCP_BRIDGE_TOKEN, UNITY_BRIDGE_HOST, UNITY_BRIDGE_PORT)
     4. Default values
     """
+    environ = os.environ
+
     # Resolve bridge token: CLI > env > file
     bridge_token: str | None = _cli_bridge_token
     if bridge_token is None:
         bridge_token = _load_bridge_token()
 
     # Resolve bridge host: CLI > env > default
-    bridge_host: str = _cli_bridge_host or os.environ.get("UNITY_BRIDGE_HOST", "127.0.0.1")
+    bridge_host: str = _cli_bridge_host or environ.get("UNITY_BRIDGE_HOST", "127.0.0.1")
 
     # Resolve bridge port: CLI > port file > env > default
     resolved_bridge_port: int
@@ -212,25 +226,25 @@ def _create_env() -> ServerEnv:
             resolved_bridge_port = discovered
         else:
             resolved_bridge_port = _parse_int(
-                os.environ.get("UNITY_BRIDGE_PORT"), default=7070, minimum=1, maximum=65535
+                environ.get("UNITY_BRIDGE_PORT"), default=7070, minimum=1, maximum=65535
             )
 
     return ServerEnv(
-        port=_parse_int(os.environ.get("MCP_SERVER_PORT"), default=6007, minimum=1, maximum=65535),
-        host=os.environ.get("MCP_SERVER_HOST", "127.0.0.1"),
-        log_level=_parse_log_level(os.environ.get("MCP_SERVER_LOG_LEVEL")),
+        port=_parse_int(environ.get("MCP_SERVER_PORT"), default=6007, minimum=1, maximum=65535),
+        host=environ.get("MCP_SERVER_HOST", "127.0.0.1"),
+        log_level=_parse_log_level(environ.get("MCP_SERVER_LOG_LEVEL")),
         unity_project_root=_project_root,
         unity_editor_log_path=_resolve_path(
-            os.environ.get("UNITY_EDITOR_LOG_PATH"), _default_editor_log()
+            environ.get("UNITY_EDITOR_LOG_PATH"), _default_editor_log()
         ),
-        enable_file_watcher=_parse_bool(os.environ.get("MCP_ENABLE_FILE_WATCHER"), True),
+        enable_file_watcher=_parse_bool(environ.get("MCP_ENABLE_FILE_WATCHER"), True),
         unity_bridge_host=bridge_host,
         unity_bridge_port=resolved_bridge_port,
         bridge_reconnect_ms=_parse_int(
-            os.environ.get("MCP_BRIDGE_RECONNECT_MS"), default=5000, minimum=0
+            environ.get("MCP_BRIDGE_RECONNECT_MS"), default=5000, minimum=0
         ),
         bridge_token=bridge_token,
-        notification_mode=_parse_notification_mode(os.environ.get("MCP_NOTIFICATION_MODE")),
+        notification_mode=_parse_notification_mode(environ.get("MCP_NOTIFICATION_MODE")),
     )
 
 
@@ -246,10 +260,14 @@ class _EnvProxy:
     """Proxy class for lazy initialization of ServerEnv.
 
     This allows CLI arguments to be applied before the first access to env attributes.
+    ServerEnv is frozen, so each resolved attribute is cached on the proxy; later
+    lookups hit the instance dict and never reach ``__getattr__`` again.
     """
 
     def __getattr__(self, name: str) -> object:
-        return getattr(_get_env(), name)
+        value = getattr(_get_env(), name)
+        self.__dict__[name] = value
+        return value
 
     def __repr__(self) -> str:
         return repr(_get_env())
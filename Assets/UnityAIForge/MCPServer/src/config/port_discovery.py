@@ -8,18 +8,24 @@ the correct port automatically.
 
 from __future__ import annotations
 
+import codecs
 import hashlib
 import json
 import logging
 import os
+import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
+from utils.json_utils import parse_json
+
 _logger = logging.getLogger(__name__)
 
 _DIRECTORY_NAME = "unity-ai-forge"
 
 
+@lru_cache(maxsize=8)
 def _compute_project_hash(project_path: Path) -> str:
     """Compute deterministic hash for a project path.
 
@@ -33,12 +39,13 @@ def _compute_project_hash(project_path: Path) -> str:
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
 
 
+@lru_cache(maxsize=1)
 def _get_discovery_directory() -> Path:
     """Return the discovery directory: %TEMP%/unity-ai-forge/"""
     return Path(tempfile.gettempdir()) / _DIRECTORY_NAME
 
 
-def _is_process_alive(pid: int) -> bool:
+def _is_process_alive_signal(pid: int) -> bool:
     """Check whether a process with the given PID is still running."""
     try:
         os.kill(pid, 0)
@@ -52,6 +59,57 @@ def _is_process_alive(pid: int) -> bool:
         return False
 
 
+def _is_process_alive_procfs(pid: int) -> bool:
+    """Check for a running process via /proc (a stat, no signal syscall).
+
+    With /proc mounted ``hidepid=2`` other users' processes are not listed, so a
+    missing entry is confirmed with the signal check before reporting it dead.
+    """
+    return pid > 0 and (os.path.exists(f"/proc/{pid}") or _is_process_alive_signal(pid))
+
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    # Full prototypes: without argtypes ctypes passes handles as a C int, which
+    # truncates (or rejects) 64-bit handle values.
+    _kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.GetExitCodeProcess.argtypes = (wintypes.HANDLE, wintypes.LPDWORD)
+    _kernel32.GetExitCodeProcess.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+    _PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    _ERROR_ACCESS_DENIED = 5
+    _STILL_ACTIVE = 259
+
+    def _is_process_alive_win32(pid: int) -> bool:
+        """Check for a running process via OpenProcess.
+
+        ``os.kill(pid, 0)`` must not be used on Windows: signal 0 is
+        CTRL_C_EVENT there, so it would interrupt the target instead of probing it.
+        """
+        handle = _kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            # The process exists but belongs to another user
+            return ctypes.get_last_error() == _ERROR_ACCESS_DENIED
+        try:
+            exit_code = wintypes.DWORD()
+            if not _kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == _STILL_ACTIVE
+        finally:
+            _kernel32.CloseHandle(handle)
+
+    _is_process_alive = _is_process_alive_win32
+elif os.path.isdir("/proc/self"):
+    _is_process_alive = _is_process_alive_procfs
+else:
+    _is_process_alive = _is_process_alive_signal
+
+
 def discover_bridge_port(project_root: Path) -> int | None:
     """Discover the bridge port for a Unity project via its port file.
 
@@ -65,12 +123,12 @@ def discover_bridge_port(project_root: Path) -> int | None:
     project_hash = _compute_project_hash(project_root)
     port_file = _get_discovery_directory() / f"{project_hash}.port"
 
-    if not port_file.exists():
+    try:
+        # C# writes the file with Encoding.UTF8, which prepends a BOM.
+        data = parse_json(port_file.read_bytes().removeprefix(codecs.BOM_UTF8))
+    except FileNotFoundError:
         _logger.debug("No port file found at %s", port_file)
         return None
-
-    try:
-        data = json.loads(port_file.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError) as exc:
         _logger.warning("Failed to read port file %s: %s", port_file, exc)
         return None
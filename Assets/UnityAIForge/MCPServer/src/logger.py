@@ -58,6 +58,8 @@ class _LazyLogger:
 
     This allows CLI arguments to be applied before logging is configured,
     ensuring the bridge_token and other settings are correctly loaded.
+    Once resolved, logging methods are cached on the instance so later calls
+    such as ``logger.info`` skip ``__getattr__`` entirely.
     """
 
     def __init__(self, name: str) -> None:
@@ -71,7 +73,12 @@ class _LazyLogger:
         return self._logger
 
     def __getattr__(self, name: str) -> object:
-        return getattr(self._get_logger(), name)
+        value = getattr(self._get_logger(), name)
+        # Only bound methods are cached; data attributes such as ``level`` can
+        # change after resolution and must keep reading through.
+        if callable(value):
+            self.__dict__[name] = value
+        return value
 
 
 logger: logging.Logger = _LazyLogger("unity-mcp-server")  # type: ignore[assignment]
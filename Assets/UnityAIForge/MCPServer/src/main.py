@@ -7,20 +7,23 @@ import contextlib
 import os
 import sys
 import time
+from collections.abc import Coroutine, Mapping
 from json import JSONDecodeError
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-import uvicorn
 from mcp.server import NotificationOptions
 from mcp.server.stdio import stdio_server as mcp_stdio_server
-from mcp.server.websocket import websocket_server as mcp_websocket_server
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.responses import JSONResponse
 from starlette.routing import Route, WebSocketRoute
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
+if TYPE_CHECKING:
+    import uvicorn
+
 # Add src directory to path for direct imports
 _package_root = Path(__file__).resolve().parent
 if str(_package_root) not in sys.path:
@@ -30,8 +33,11 @@ from bridge.bridge_connector import bridge_connector
 from bridge.bridge_manager import bridge_manager
 from config.env import env
 from logger import logger
+from prompts.prompt_definitions import PROMPT_TEMPLATE_MAP
+from prompts.template_loader import load_prompt_template
 from server.create_mcp_server import create_mcp_server
 from services.editor_log_watcher import editor_log_watcher
+from utils.json_utils import as_json_bytes
 from version import SERVER_NAME, SERVER_VERSION
 
 mcp_server = create_mcp_server()
@@ -92,20 +98,29 @@ bridge_manager.on("disconnected", _bridge_disconnected)
 bridge_manager.on("contextUpdated", _bridge_context_updated)
 
 
+class _CompactJSONResponse(JSONResponse):
+    """JSONResponse rendered by the shared encoder (orjson when installed)."""
+
+    def render(self, content: Any) -> bytes:
+        return as_json_bytes(content)
+
+
+_SERVER_INFO = {"server": SERVER_NAME, "version": SERVER_VERSION}
+
+
 async def health_endpoint(_: Request) -> JSONResponse:
-    return JSONResponse(
+    return _CompactJSONResponse(
         {
             "status": "ok",
             "bridgeConnected": bridge_manager.is_connected(),
             "lastHeartbeatAt": bridge_manager.get_last_heartbeat(),
-            "server": SERVER_NAME,
-            "version": SERVER_VERSION,
+            **_SERVER_INFO,
         }
     )
 
 
 async def bridge_status_endpoint(_: Request) -> JSONResponse:
-    return JSONResponse(
+    return _CompactJSONResponse(
         {
             "connected": bridge_manager.is_connected(),
             "sessionId": bridge_manager.get_session_id(),
@@ -115,21 +130,35 @@ async def bridge_status_endpoint(_: Request) -> JSONResponse:
     )
 
 
+# Fixed responses are rendered once and reused; Starlette responses hold only
+# their pre-rendered body and headers, so they can be sent to any number of clients.
+_RATE_LIMITED_RESPONSE = JSONResponse(
+    {"error": "Rate limit exceeded. Try again shortly."}, status_code=429
+)
+_BRIDGE_DISCONNECTED_RESPONSE = JSONResponse(
+    {"error": "Unity bridge is not connected"}, status_code=503
+)
+_INVALID_JSON_RESPONSE = JSONResponse({"error": "Invalid JSON payload"}, status_code=400)
+_MISSING_TOOL_NAME_RESPONSE = JSONResponse(
+    {"error": "Field 'toolName' is required"}, status_code=400
+)
+
+
 async def bridge_command_endpoint(request: Request) -> JSONResponse:
     if not _bridge_command_limiter.is_allowed():
-        return JSONResponse({"error": "Rate limit exceeded. Try again shortly."}, status_code=429)
+        return _RATE_LIMITED_RESPONSE
 
     if not bridge_manager.is_connected():
-        return JSONResponse({"error": "Unity bridge is not connected"}, status_code=503)
+        return _BRIDGE_DISCONNECTED_RESPONSE
 
     try:
         body = await request.json()
     except JSONDecodeError:
-        return JSONResponse({"error": "Invalid JSON payload"}, status_code=400)
+        return _INVALID_JSON_RESPONSE
 
     tool_name = body.get("toolName")
     if not tool_name:
-        return JSONResponse({"error": "Field 'toolName' is required"}, status_code=400)
+        return _MISSING_TOOL_NAME_RESPONSE
 
     payload = body.get("payload")
     timeout_ms = body.get("timeoutMs")
@@ -157,10 +186,6 @@ async def bridge_command_endpoint(request: Request) -> JSONResponse:
     return JSONResponse({"ok": True, "result": result})
 
 
-async def default_endpoint(_: Request) -> PlainTextResponse:
-    return PlainTextResponse("Not Found", status_code=404)
-
-
 async def mcp_ws_endpoint(websocket: WebSocket) -> None:
     client = websocket.client
     logger.info(
@@ -170,6 +195,8 @@ async def mcp_ws_endpoint(websocket: WebSocket) -> None:
         websocket.headers.get("user-agent"),
     )
 
+    from mcp.server.websocket import websocket_server as mcp_websocket_server
+
     try:
         async with mcp_websocket_server(websocket.scope, websocket.receive, websocket.send) as (
             read_stream,
@@ -185,7 +212,19 @@ async def mcp_ws_endpoint(websocket: WebSocket) -> None:
             await websocket.close()
 
 
+_template_prewarm_task: asyncio.Task[None] | None = None
+
+
+def _prewarm_prompt_templates() -> None:
+    """Load every prompt template into the loader cache."""
+    for templates in PROMPT_TEMPLATE_MAP.values():
+        for relative_path in templates.values():
+            with contextlib.suppress(FileNotFoundError):
+                load_prompt_template(relative_path)
+
+
 async def startup() -> None:
+    global _template_prewarm_task
     logger.info(
         "Starting Unity MCP server (host=%s port=%s)",
         env.host,
@@ -195,12 +234,11 @@ async def startup() -> None:
         "Unity Bridge target: %s:%s (token=%s)",
         env.unity_bridge_host,
         env.unity_bridge_port,
-        (
-            "****" + env.bridge_token[-4:]
-            if env.bridge_token and len(env.bridge_token) > 4
-            else ("set" if env.bridge_token else "not set")
-        ),
+        env.bridge_token_masked,
     )
+    # Read prompt templates off the event loop while the bridge connects, so
+    # the first get_prompt call does not wait on disk I/O.
+    _template_prewarm_task = asyncio.create_task(asyncio.to_thread(_prewarm_prompt_templates))
     await editor_log_watcher.start()
     bridge_connector.start()
 
@@ -209,19 +247,35 @@ async def shutdown() -> None:
     logger.info("Shutting down Unity MCP server")
     await bridge_connector.stop()
     await editor_log_watcher.stop()
+    if _template_prewarm_task is not None:
+        with contextlib.suppress(Exception):
+            await _template_prewarm_task
 
 
 routes = [
     Route("/healthz", health_endpoint, methods=["GET"]),
     Route("/bridge/status", bridge_status_endpoint, methods=["GET"]),
     Route("/bridge/command", bridge_command_endpoint, methods=["POST"]),
-    Route("/{path:path}", default_endpoint, methods=["GET", "POST", "PUT", "PATCH", "DELETE"]),
     WebSocketRoute("/mcp", mcp_ws_endpoint),
 ]
 
 app = Starlette(routes=routes, on_startup=[startup], on_shutdown=[shutdown])
 
 
+# Maps MCP_SERVER_LOG_LEVEL values to uvicorn's log level names.
+_UVICORN_LOG_LEVELS: Mapping[str, str] = MappingProxyType(
+    {
+        "trace": "debug",
+        "debug": "debug",
+        "info": "info",
+        "warn": "warning",
+        "error": "error",
+        "fatal": "critical",
+        "silent": "critical",
+    }
+)
+
+
 def _run_with_uv(config: uvicorn.Config) -> bool:
     try:
         import uv  # type: ignore[import-not-found]
@@ -249,7 +303,7 @@ def _run_with_uv(config: uvicorn.Config) -> bool:
 
 def _run_with_asyncio(config: uvicorn.Config) -> None:
     try:
-        asyncio.run(_serve(config))
+        _run_event_loop(_serve(config))
     except KeyboardInterrupt:
         logger.info("Received interrupt, shutting down")
     except Exception:
@@ -257,7 +311,20 @@ def _run_with_asyncio(config: uvicorn.Config) -> None:
         sys.exit(1)
 
 
+def _run_event_loop(main: Coroutine[Any, Any, None]) -> None:
+    """Run *main* on uvloop when it is installed, otherwise on the stdlib loop."""
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        asyncio.run(main)
+        return
+
+    uvloop.run(main)
+
+
 async def _serve(config: uvicorn.Config) -> None:
+    import uvicorn
+
     server = uvicorn.Server(config)
     await server.serve()
 
@@ -312,7 +379,7 @@ def main(argv: list[str] | None = None) -> None:
 
     if args.transport == "stdio":
         try:
-            asyncio.run(_run_stdio())
+            _run_event_loop(_run_stdio())
         except KeyboardInterrupt:
             logger.info("Received interrupt, shutting down")
         except Exception:
@@ -320,22 +387,19 @@ def main(argv: list[str] | None = None) -> None:
             sys.exit(1)
         return
 
-    log_level = {
-        "trace": "debug",
-        "debug": "debug",
-        "info": "info",
-        "warn": "warning",
-        "error": "error",
-        "fatal": "critical",
-        "silent": "critical",
-    }.get(env.log_level, "info")
+    # The HTTP stack is only needed for the websocket transport.
+    import uvicorn
+
+    log_level = _UVICORN_LOG_LEVELS.get(env.log_level, "info")
 
     config = uvicorn.Config(
         app,
         host=env.host,
         port=env.port,
         log_level=log_level,
-        loop="asyncio",
+        # _serve() runs inside a loop we create (see _run_event_loop); "auto"
+        # describes the same uvloop-if-installed choice to uvicorn.
+        loop="auto",
         lifespan="on",
     )
     if _run_with_uv(config):
@@ -6,12 +6,18 @@ supporting version placeholder replacement.
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 
+from utils.fs_utils import read_utf8_text
 
+
+@cache
 def load_system_prompt(version: str) -> str:
     """Load system prompt from markdown file with version substitution.
 
+    The result is cached per version, so the file is read only once per process.
+
     Args:
         version: Server version string to substitute in the prompt
 
@@ -23,10 +29,10 @@ def load_system_prompt(version: str) -> str:
     """
     prompt_path = Path(__file__).parent / "system_instructions.md"
 
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"System prompt file not found: {prompt_path}")
-
-    content = prompt_path.read_text(encoding="utf-8")
+    try:
+        content = read_utf8_text(prompt_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"System prompt file not found: {prompt_path}") from None
 
     # Replace version placeholder
     content = content.replace("{VERSION}", version)
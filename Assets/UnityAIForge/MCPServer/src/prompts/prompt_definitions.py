@@ -6,11 +6,14 @@ This is the single source of truth for all prompt metadata.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 import mcp.types as types
 
 # --- Argument option lists ---
 
-GENRE_OPTIONS: list[str] = [
+GENRE_OPTIONS: tuple[str, ...] = (
     "platformer_2d",
     "rpg_turnbased",
     "puzzle",
@@ -18,9 +21,9 @@ GENRE_OPTIONS: list[str] = [
     "action_2d",
     "card_game",
     "tactics_srpg",
-]
+)
 
-MECHANIC_OPTIONS: list[str] = [
+MECHANIC_OPTIONS: tuple[str, ...] = (
     "state_machine",
     "inventory",
     "save_load",
@@ -30,9 +33,9 @@ MECHANIC_OPTIONS: list[str] = [
     "object_pooling",
     "event_channel",
     "animation_controller",
-]
+)
 
-WORKFLOW_OPTIONS: list[str] = [
+WORKFLOW_OPTIONS: tuple[str, ...] = (
     "planning",
     "design",
     "project_setup",
@@ -45,7 +48,7 @@ WORKFLOW_OPTIONS: list[str] = [
     "feature_implementation",
     "ui_review",
     "prefab_quality_check",
-]
+)
 
 # --- Prompt definitions ---
 
@@ -86,18 +89,21 @@ PROMPT_DEFINITIONS: list[types.Prompt] = [
 ]
 
 # --- Template path mapping ---
-# Maps (prompt_name, argument_value) -> relative template path
-
-PROMPT_TEMPLATE_MAP: dict[tuple[str, str], str] = {}
-
-for _genre in GENRE_OPTIONS:
-    PROMPT_TEMPLATE_MAP[("game_genre_guide", _genre)] = f"genre/{_genre}.md"
-
-for _mechanic in MECHANIC_OPTIONS:
-    PROMPT_TEMPLATE_MAP[("game_mechanics_guide", _mechanic)] = f"mechanics/{_mechanic}.md"
-
-for _phase in WORKFLOW_OPTIONS:
-    PROMPT_TEMPLATE_MAP[("game_workflow_guide", _phase)] = f"workflow/{_phase}.md"
+# Maps prompt_name -> argument_value -> relative template path
+
+PROMPT_TEMPLATE_MAP: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        "game_genre_guide": MappingProxyType(
+            {genre: f"genre/{genre}.md" for genre in GENRE_OPTIONS}
+        ),
+        "game_mechanics_guide": MappingProxyType(
+            {mechanic: f"mechanics/{mechanic}.md" for mechanic in MECHANIC_OPTIONS}
+        ),
+        "game_workflow_guide": MappingProxyType(
+            {phase: f"workflow/{phase}.md" for phase in WORKFLOW_OPTIONS}
+        ),
+    }
+)
 
 # --- Argument name per prompt ---
 
@@ -109,8 +115,13 @@ PROMPT_ARG_NAME: dict[str, str] = {
 
 # --- Valid values per prompt ---
 
-PROMPT_VALID_VALUES: dict[str, list[str]] = {
+PROMPT_VALID_VALUES: dict[str, tuple[str, ...]] = {
     "game_genre_guide": GENRE_OPTIONS,
     "game_mechanics_guide": MECHANIC_OPTIONS,
     "game_workflow_guide": WORKFLOW_OPTIONS,
 }
+
+# Comma-separated valid values per prompt, used in validation error messages
+PROMPT_VALID_VALUES_TEXT: dict[str, str] = {
+    name: ", ".join(values) for name, values in PROMPT_VALID_VALUES.items()
+}
@@ -12,7 +12,7 @@ from prompts.prompt_definitions import (
     PROMPT_ARG_NAME,
     PROMPT_DEFINITIONS,
     PROMPT_TEMPLATE_MAP,
-    PROMPT_VALID_VALUES,
+    PROMPT_VALID_VALUES_TEXT,
 )
 from prompts.template_loader import load_prompt_template
 
@@ -37,22 +37,19 @@ def register_prompts(server: Server) -> None:
             raise ValueError(f"Unknown prompt name: {name}")
 
         arg_name = PROMPT_ARG_NAME[name]
-        valid_values = PROMPT_VALID_VALUES[name]
+        valid_values = PROMPT_VALID_VALUES_TEXT[name]
 
         if not arguments or arg_name not in arguments:
-            raise ValueError(
-                f"Argument '{arg_name}' is required." f" Valid values: {', '.join(valid_values)}"
-            )
+            raise ValueError(f"Argument '{arg_name}' is required. Valid values: {valid_values}")
 
         arg_value = arguments[arg_name]
 
-        if arg_value not in valid_values:
-            raise ValueError(
-                f"'{arg_value}' is not a valid value." f" Valid values: {', '.join(valid_values)}"
-            )
+        # The template map holds exactly the valid values per prompt, so one
+        # lookup both validates the argument and resolves the template.
+        template_path = PROMPT_TEMPLATE_MAP[name].get(arg_value)
+        if template_path is None:
+            raise ValueError(f"'{arg_value}' is not a valid value. Valid values: {valid_values}")
 
-        template_key = (name, arg_value)
-        template_path = PROMPT_TEMPLATE_MAP[template_key]
         content = load_prompt_template(template_path)
 
         return types.GetPromptResult(
@@ -6,16 +6,22 @@ with version placeholder replacement.
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 
+from utils.fs_utils import read_utf8_text
 from version import SERVER_VERSION
 
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
 
+@cache
 def load_prompt_template(relative_path: str) -> str:
     """Load a prompt template file with version substitution.
 
+    Templates ship with the server and do not change at runtime, so each one is
+    read from disk only once per process.
+
     Args:
         relative_path: Path relative to the templates/ directory (e.g. "genre/platformer_2d.md")
 
@@ -27,13 +33,12 @@ def load_prompt_template(relative_path: str) -> str:
     """
     template_path = TEMPLATES_DIR / relative_path
 
-    if not template_path.exists():
-        raise FileNotFoundError(f"テンプレートファイルが見つかりません: {template_path}")
-
-    content = template_path.read_text(encoding="utf-8")
-    content = content.replace("{VERSION}", SERVER_VERSION)
+    try:
+        content = read_utf8_text(template_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"テンプレートファイルが見つかりません: {template_path}") from None
 
-    return content
+    return content.replace("{VERSION}", SERVER_VERSION)
 
 
 def list_available_templates() -> list[str]:
@@ -42,9 +47,7 @@ def list_available_templates() -> list[str]:
     Returns:
         Sorted list of relative paths to template files.
     """
-    if not TEMPLATES_DIR.exists():
-        return []
-
+    # rglob() yields nothing for a missing directory, so no exists() check is needed.
     return sorted(
         str(p.relative_to(TEMPLATES_DIR)).replace("\\", "/") for p in TEMPLATES_DIR.rglob("*.md")
     )
@@ -12,6 +12,8 @@ import logging
 
 from mcp.types import Resource
 
+from tools.batch_sequential import get_batch_manager
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,14 +38,12 @@ async def read_batch_queue_resource(uri: str) -> str:
     Returns:
         JSON string with queue status
     """
-    # Import here to avoid circular dependency
-    from tools.batch_sequential import get_batch_manager
-
     if uri == "batch://queue/status":
         manager = get_batch_manager()
 
         # Acquire lock for thread-safe read
         async with manager.lock:
+            await manager.load_async()
             state = manager.state
             status = state.to_dict()
 
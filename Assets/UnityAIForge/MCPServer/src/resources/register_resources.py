@@ -4,30 +4,45 @@ MCP Resources for Unity-AI-Forge
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
 from mcp import types as mcp_types
 from mcp.server import Server
 
 from resources.batch_queue import get_batch_queue_resources, read_batch_queue_resource
 
+if TYPE_CHECKING:
+    from pydantic import AnyUrl
+
+# Resource readers keyed by URI scheme; add a scheme here to expose new resources.
+_SCHEME_HANDLERS: Mapping[str, Callable[[str], Awaitable[str]]] = MappingProxyType(
+    {
+        "batch": read_batch_queue_resource,
+    }
+)
+
 
 def register_resources(server: Server) -> None:
     """Register MCP resources.
 
     Resources provide read-only access to server state and information.
     """
+    # The resource descriptors are static, so build the listing once.
+    resources: list[mcp_types.Resource] = [*get_batch_queue_resources()]
 
     @server.list_resources()
     async def list_resources() -> list[mcp_types.Resource]:
         """List all available resources."""
-        resources: list[mcp_types.Resource] = []
-        resources.extend(get_batch_queue_resources())
         return resources
 
     @server.read_resource()
-    async def read_resource(uri: str) -> str:
+    async def read_resource(uri: AnyUrl) -> str:
         """Read a resource by URI."""
-        # Batch queue resources
-        if uri.startswith("batch://"):
-            return await read_batch_queue_resource(uri)
-
-        raise ValueError(f"Unknown resource URI: {uri}")
+        # The MCP layer passes a pydantic URL object; readers match on the string form.
+        uri_text = str(uri)
+        handler = _SCHEME_HANDLERS.get(uri_text.partition("://")[0])
+        if handler is None:
+            raise ValueError(f"Unknown resource URI: {uri_text}")
+        return await handler(uri_text)
@@ -5,6 +5,8 @@ Creates and configures the MCP server with all tools, resources, and prompts.
 
 from __future__ import annotations
 
+from functools import cache
+
 from mcp.server import Server
 
 from prompts.loader import load_system_prompt
@@ -14,9 +16,13 @@ from tools.register_tools import register_tools
 from version import SERVER_NAME, SERVER_VERSION
 
 
+@cache
 def create_mcp_server() -> Server:
     """Create and configure the Unity-AI-Forge MCP server.
 
+    The server is built once per process; later calls return the same
+    instance. Use ``create_mcp_server.cache_clear()`` to force a rebuild.
+
     Returns:
         Configured MCP Server instance with all tools, resources, and prompts registered.
     """
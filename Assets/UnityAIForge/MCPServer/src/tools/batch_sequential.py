@@ -12,22 +12,36 @@ Thread Safety:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
-from datetime import datetime
+import os
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from mcp.types import TextContent, Tool
 
 from bridge.bridge_manager import BridgeManager
-from tools.tool_registry import resolve_tool_name
+from tools.tool_registry import CS_SCRIPT_SUFFIXES, resolve_tool_name
+from utils.json_utils import as_json_bytes, parse_json
 
 logger = logging.getLogger(__name__)
 
 # State file to persist queue
 STATE_FILE = Path(__file__).parent.parent.parent / ".batch_queue_state.json"
 
+# Progress records appended to the log beyond this size are folded back into
+# a fresh snapshot, so replay on load stays short.
+WAL_COMPACT_BYTES = 4096
+
+_PROGRESS_FIELDS = ("current_index", "last_error", "last_error_index", "last_updated")
+
+
+def _wal_file() -> Path:
+    """Progress log that sits next to the state snapshot."""
+    return STATE_FILE.with_suffix(".wal")
+
 
 class BatchQueueState:
     """Manages the state of the batch queue.
@@ -71,11 +85,20 @@ class BatchQueueState:
         return state
 
     def _save_to_file(self) -> None:
-        """Save state to file (internal, not thread-safe)."""
+        """Save a full state snapshot and drop the progress log (internal, not thread-safe).
+
+        The snapshot is written to a temporary file and renamed over the old
+        one, so a crash mid-write never leaves a truncated state file behind.
+        """
+        tmp_file = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
         try:
             STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(STATE_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            with open(tmp_file, "wb") as f:
+                f.write(as_json_bytes(self.to_dict()))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, STATE_FILE)
+            _wal_file().unlink(missing_ok=True)
             logger.info(
                 "Batch queue state saved: %d/%d",
                 self.current_index,
@@ -83,26 +106,71 @@ class BatchQueueState:
             )
         except OSError as exc:
             logger.error("Failed to save batch queue state: %s", exc)
+        finally:
+            # Already renamed away on success; otherwise drop the partial write.
+            with contextlib.suppress(OSError):
+                tmp_file.unlink(missing_ok=True)
+
+    def _append_progress(self) -> None:
+        """Append the current progress to the log (internal, not thread-safe).
+
+        Only the cursor and error fields change while a batch runs, so each
+        step writes one short line instead of re-serializing every operation.
+        """
+        record = {field: getattr(self, field) for field in _PROGRESS_FIELDS}
+        record["started_at"] = self.started_at
+        line = as_json_bytes(record) + b"\n"
+        try:
+            with open(_wal_file(), "ab") as f:
+                f.write(line)
+                size = f.tell()
+        except OSError as exc:
+            logger.error("Failed to append batch queue progress: %s", exc)
+            return
+        if size > WAL_COMPACT_BYTES:
+            self._save_to_file()
 
     @classmethod
     def _load_from_file(cls) -> BatchQueueState:
         """Load state from file (internal, not thread-safe)."""
         try:
-            if STATE_FILE.exists():
-                with open(STATE_FILE, encoding="utf-8") as f:
-                    data = json.load(f)
-                logger.info(
-                    "Batch queue state loaded: %d/%d",
-                    data.get("current_index", 0),
-                    data.get("total_count", 0),
-                )
-                return cls.from_dict(data)
+            data = parse_json(STATE_FILE.read_bytes())
+            state = cls.from_dict(data)
+            state._replay_progress()
+            logger.info(
+                "Batch queue state loaded: %d/%d",
+                state.current_index,
+                len(state.operations),
+            )
+            return state
+        except FileNotFoundError:
+            pass
         except json.JSONDecodeError as exc:
             logger.error("Failed to parse batch queue state file: %s", exc)
         except OSError as exc:
             logger.error("Failed to load batch queue state: %s", exc)
         return cls()
 
+    def _replay_progress(self) -> None:
+        """Apply progress records logged after the snapshot (internal, not thread-safe)."""
+        try:
+            lines = _wal_file().read_bytes().splitlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                record = parse_json(line)
+            except json.JSONDecodeError:
+                # A crash mid-append leaves at most one partial trailing line.
+                break
+            if record.get("started_at") != self.started_at:
+                # Left over from an earlier batch if a crash hit between
+                # replacing the snapshot and removing the log.
+                continue
+            for field in _PROGRESS_FIELDS:
+                if field in record:
+                    setattr(self, field, record[field])
+
     def _clear(self) -> None:
         """Clear the state (internal, not thread-safe)."""
         self.operations = []
@@ -111,11 +179,11 @@ class BatchQueueState:
         self.last_error_index = None
         self.started_at = None
         self.last_updated = None
-        if STATE_FILE.exists():
-            try:
-                STATE_FILE.unlink()
-            except OSError as exc:
-                logger.warning("Failed to delete batch queue state file: %s", exc)
+        try:
+            STATE_FILE.unlink(missing_ok=True)
+            _wal_file().unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning("Failed to delete batch queue state file: %s", exc)
         logger.info("Batch queue state cleared")
 
 
@@ -129,14 +197,22 @@ class BatchQueueManager:
     Usage:
         manager = BatchQueueManager()
         async with manager.lock:
+            await manager.load_async()
             state = manager.state
             # ... modify state ...
-            manager.save()
+            await manager.save_async()  # or record_progress_async() for cursor/error updates
+
+    The ``*_async`` variants run the file I/O in a worker thread so the event
+    loop is not blocked; the synchronous ones remain for non-async callers.
     """
 
     def __init__(self) -> None:
         self._lock = asyncio.Lock()
-        self._state = BatchQueueState._load_from_file()
+        # Persisted state is read on first use (load_async), not at import.
+        self._state = BatchQueueState()
+        self._loaded = False
+        # True while execute_batch_sequential is working through the queue
+        self.running = False
 
     @property
     def lock(self) -> asyncio.Lock:
@@ -152,10 +228,32 @@ class BatchQueueManager:
         """Save state to file (caller must hold lock)."""
         self._state._save_to_file()
 
+    def record_progress(self) -> None:
+        """Log cursor and error changes without rewriting the snapshot (caller must hold lock)."""
+        self._state._append_progress()
+
     def clear(self) -> None:
         """Clear the state (caller must hold lock)."""
         self._state._clear()
 
+    async def load_async(self) -> None:
+        """Load the persisted state once, in a worker thread (caller must hold lock)."""
+        if not self._loaded:
+            self._state = await asyncio.to_thread(BatchQueueState._load_from_file)
+            self._loaded = True
+
+    async def save_async(self) -> None:
+        """Like save(), with the file I/O run in a worker thread (caller must hold lock)."""
+        await asyncio.to_thread(self._state._save_to_file)
+
+    async def record_progress_async(self) -> None:
+        """Like record_progress(), run in a worker thread (caller must hold lock)."""
+        await asyncio.to_thread(self._state._append_progress)
+
+    async def clear_async(self) -> None:
+        """Like clear(), with the file I/O run in a worker thread (caller must hold lock)."""
+        await asyncio.to_thread(self._state._clear)
+
     def get_state_dict(self) -> dict[str, Any]:
         """Get state as dictionary (caller must hold lock)."""
         return self._state.to_dict()
@@ -203,28 +301,75 @@ async def execute_batch_sequential(
     """
     # Initialize or resume state (lock held only for state access)
     async with _batch_manager.lock:
-        state = _batch_manager.state
-        current_time = datetime.utcnow().isoformat()
-
-        if not resume or not state.operations:
-            # Start fresh
-            state.operations = operations
-            state.current_index = 0
-            state.last_error = None
-            state.last_error_index = None
-            state.started_at = current_time
-            logger.info("Starting new batch execution with %d operations", len(operations))
-        else:
-            # Resume from saved state
-            logger.info(
-                "Resuming batch execution from operation %d/%d",
-                state.current_index,
-                len(state.operations),
-            )
+        await _batch_manager.load_async()
+        if _batch_manager.running:
+            # The queue holds a single batch; starting another would replace
+            # the operations the running batch is still working through.
+            return {
+                "success": False,
+                "stopped_at_index": None,
+                "completed": [],
+                "errors": [],
+                "message": "Another batch is already running. Wait for it to finish.",
+                "last_error": None,
+            }
+        _batch_manager.running = True
+
+    try:
+        async with _batch_manager.lock:
+            state = _batch_manager.state
+            current_time = datetime.now(timezone.utc).isoformat()
+
+            if not resume or not state.operations:
+                # Start fresh
+                state.operations = operations
+                state.current_index = 0
+                state.last_error = None
+                state.last_error_index = None
+                state.started_at = current_time
+                logger.info("Starting new batch execution with %d operations", len(operations))
+            else:
+                # Resume from saved state
+                logger.info(
+                    "Resuming batch execution from operation %d/%d",
+                    state.current_index,
+                    len(state.operations),
+                )
+
+            state.last_updated = current_time
+            await _batch_manager.save_async()
+
+        return await _run_operations(bridge_client, stop_on_error)
+    finally:
+        _batch_manager.running = False
+
+
+def _stop_response(
+    idx: int,
+    total_ops: int,
+    results: list[dict[str, Any]],
+    errors: list[dict[str, Any]],
+    error_msg: str,
+    cause: str,
+) -> dict[str, Any]:
+    """Build the result for a batch halted at operation *idx* by *cause*."""
+    message = f"Execution stopped at operation {idx + 1} due to {cause}."
+    # Resuming re-runs the failed operation, which cannot help a bad tool name.
+    if cause != "invalid tool name":
+        message += " Use resume=true to continue."
+    return {
+        "success": False,
+        "stopped_at_index": idx,
+        "completed": results,
+        "errors": errors,
+        "remaining_operations": total_ops - idx,
+        "message": message,
+        "last_error": error_msg,
+    }
 
-        state.last_updated = current_time
-        _batch_manager.save()
 
+async def _run_operations(bridge_client: BridgeManager, stop_on_error: bool) -> dict[str, Any]:
+    """Run the queued operations from the saved cursor (caller marks the queue running)."""
     results: list[dict[str, Any]] = []
     errors: list[dict[str, Any]] = []
 
@@ -262,19 +407,14 @@ async def execute_batch_sequential(
                 state.last_error = error_msg
                 state.last_error_index = idx
                 if stop_on_error:
-                    _batch_manager.save()
-                    return {
-                        "success": False,
-                        "stopped_at_index": idx,
-                        "completed": results,
-                        "errors": errors,
-                        "remaining_operations": len(state.operations) - state.current_index,
-                        "message": f"Execution stopped at operation {idx + 1} due to invalid tool name.",
-                        "last_error": error_msg,
-                    }
+                    await _batch_manager.record_progress_async()
+                    return _stop_response(
+                        idx, total_ops, results, errors, error_msg, "invalid tool name"
+                    )
                 # Continue to next operation if not stopping on error
                 state.current_index += 1
-                _batch_manager.save()
+                if state.current_index < len(state.operations):
+                    await _batch_manager.record_progress_async()
             continue
 
         logger.info(
@@ -317,16 +457,8 @@ async def execute_batch_sequential(
                         state = _batch_manager.state
                         state.last_error = error_msg
                         state.last_error_index = idx
-                        _batch_manager.save()
-                    return {
-                        "success": False,
-                        "stopped_at_index": idx,
-                        "completed": results,
-                        "errors": errors,
-                        "remaining_operations": total_ops - idx,
-                        "message": f"Execution stopped at operation {idx + 1} due to error. Use resume=true to continue.",
-                        "last_error": error_msg,
-                    }
+                        await _batch_manager.record_progress_async()
+                    return _stop_response(idx, total_ops, results, errors, error_msg, "error")
 
         except Exception as exc:
             error_msg = str(exc)
@@ -345,16 +477,8 @@ async def execute_batch_sequential(
                     state = _batch_manager.state
                     state.last_error = error_msg
                     state.last_error_index = idx
-                    _batch_manager.save()
-                return {
-                    "success": False,
-                    "stopped_at_index": idx,
-                    "completed": results,
-                    "errors": errors,
-                    "remaining_operations": total_ops - idx,
-                    "message": f"Execution stopped at operation {idx + 1} due to exception. Use resume=true to continue.",
-                    "last_error": error_msg,
-                }
+                    await _batch_manager.record_progress_async()
+                return _stop_response(idx, total_ops, results, errors, error_msg, "exception")
 
         # Auto-inject compilation wait if the operation requires it
         needs_compile = False
@@ -364,7 +488,7 @@ async def execute_batch_sequential(
         if original_tool_name == "unity_asset_crud":
             op = arguments.get("operation", "")
             ap = arguments.get("assetPath", "")
-            if op in ("create", "update", "delete") and ap.lower().endswith(".cs"):
+            if op in ("create", "update", "delete") and ap.endswith(CS_SCRIPT_SUFFIXES):
                 needs_compile = True
 
         if needs_compile:
@@ -385,9 +509,9 @@ async def execute_batch_sequential(
                     ):
                         next_also_generates = True
                     # asset_crud with .cs → batch
-                    if next_tool == "unity_asset_crud" and next_args.get(
-                        "assetPath", ""
-                    ).lower().endswith(".cs"):
+                    if next_tool == "unity_asset_crud" and next_args.get("assetPath", "").endswith(
+                        CS_SCRIPT_SUFFIXES
+                    ):
                         if next_args.get("operation", "") in ("create", "update", "delete"):
                             next_also_generates = True
 
@@ -408,17 +532,19 @@ async def execute_batch_sequential(
                         compile_exc,
                     )
 
-        # Move to next operation (under lock)
+        # Move to next operation (under lock). After the last one the queue is
+        # cleared right away, so there is no progress worth writing.
         async with _batch_manager.lock:
             state = _batch_manager.state
             state.current_index += 1
-            _batch_manager.save()
+            if state.current_index < len(state.operations):
+                await _batch_manager.record_progress_async()
 
     # All operations completed
     async with _batch_manager.lock:
         state = _batch_manager.state
         total = len(state.operations)
-        _batch_manager.clear()
+        await _batch_manager.clear_async()
 
     return {
         "success": len(errors) == 0,
@@ -491,6 +617,28 @@ Use cases:
 )
 
 
+def _find_invalid_operation(operations: list[Any]) -> int | None:
+    """Return the index of the first malformed operation, or None if all are valid."""
+    for index, operation in enumerate(operations):
+        if not isinstance(operation, dict):
+            return index
+        if not isinstance(operation.get("tool"), str):
+            return index
+        if not isinstance(operation.get("arguments", {}), dict):
+            return index
+    return None
+
+
+def _error_content(message: str) -> list[TextContent]:
+    """Wrap a validation error as the tool's JSON text response."""
+    return [
+        TextContent(
+            type="text",
+            text=json.dumps({"success": False, "error": message}, indent=2),
+        )
+    ]
+
+
 async def handle_batch_sequential(
     arguments: dict[str, Any], bridge_client: BridgeManager
 ) -> list[TextContent]:
@@ -501,18 +649,18 @@ async def handle_batch_sequential(
 
     # Validate operations
     if not resume and not operations:
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(
-                    {
-                        "success": False,
-                        "error": "No operations provided. Specify 'operations' array or set 'resume' to true.",
-                    },
-                    indent=2,
-                ),
-            )
-        ]
+        return _error_content(
+            "No operations provided. Specify 'operations' array or set 'resume' to true."
+        )
+
+    # Check every operation's shape before any of them runs, so a malformed
+    # entry cannot stop a batch halfway through.
+    invalid_index = _find_invalid_operation(operations)
+    if invalid_index is not None:
+        return _error_content(
+            f"Operation {invalid_index + 1} must be an object with a 'tool' string "
+            "and an 'arguments' object."
+        )
 
     # Execute batch
     result = await execute_batch_sequential(
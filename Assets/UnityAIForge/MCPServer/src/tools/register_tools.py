@@ -9,9 +9,14 @@ definitions live in ``tools.schemas``, the 41 tool definitions in
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
+from collections.abc import Awaitable, Callable, Mapping
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
+import jsonschema  # type: ignore[import-untyped]
 import mcp.types as types
 from mcp.server import Server
 
@@ -20,10 +25,17 @@ from config.env import env
 from logger import logger
 from tools.batch_sequential import handle_batch_sequential
 from tools.tool_definitions import get_tool_definitions
-from tools.tool_registry import TOOL_NAME_TO_BRIDGE
+from tools.tool_registry import CS_SCRIPT_SUFFIXES, TOOL_NAME_TO_BRIDGE
 from utils.json_utils import as_pretty_json
 from utils.notification import notify_tool_result
 
+# unity_compilation_await falls back to polling Unity for compilation start
+# between compilation:started notifications. Compilation usually begins right
+# after the triggering edit, so polls start fast and back off.
+COMPILE_POLL_INITIAL_SECONDS = 0.05
+COMPILE_POLL_MAX_SECONDS = 0.5
+COMPILE_POLL_BACKOFF = 1.5
+
 
 def _ensure_bridge_connected() -> None:
     if not bridge_manager.is_connected():
@@ -40,6 +52,11 @@ def _return_with_notification(tool_name: str, content: list[types.Content]) -> l
 
 
 async def _call_bridge_tool(tool_name: str, payload: dict[str, Any]) -> list[types.Content]:
+    return _to_content(await _send_bridge_tool(tool_name, payload))
+
+
+async def _send_bridge_tool(tool_name: str, payload: dict[str, Any]) -> Any:
+    """Send a bridge command and return Unity's response unserialized."""
     _ensure_bridge_connected()
 
     timeout_ms = 45_000
@@ -52,212 +69,292 @@ async def _call_bridge_tool(tool_name: str, payload: dict[str, Any]) -> list[typ
     except Exception as exc:  # pragma: no cover - surface bridge errors to client
         raise RuntimeError(f'Unity bridge tool "{tool_name}" failed: {exc}') from exc
 
-    text = response if isinstance(response, str) else as_pretty_json(response)
-    return [types.TextContent(type="text", text=text)]
+    return response
 
 
-def register_tools(server: Server) -> None:
-    tool_definitions = get_tool_definitions()
-    tool_map = {tool.name: tool for tool in tool_definitions}
+def _to_text(response: Any) -> str:
+    return response if isinstance(response, str) else as_pretty_json(response)
 
-    @server.list_tools()
-    async def list_tools() -> list[types.Tool]:
-        return tool_definitions
 
-    @server.call_tool()
-    async def call_tool(name: str, arguments: dict | None) -> list[types.Content]:
-        if name not in tool_map:
-            raise RuntimeError(f"Unknown tool requested: {name}")
+def _to_content(response: Any) -> list[types.Content]:
+    return [types.TextContent(type="text", text=_to_text(response))]
 
-        args = arguments or {}
 
-        # ── Special tools ───────────────────────────────────────────
-        if name == "unity_ping":
-            _ensure_bridge_connected()
-            heartbeat = bridge_manager.get_last_heartbeat()
-            bridge_response = await bridge_manager.send_command("pingUnityEditor", {})
-            payload = {
-                "connected": True,
-                "lastHeartbeatAt": heartbeat,
-                "bridgeResponse": bridge_response,
-            }
-            return [types.TextContent(type="text", text=as_pretty_json(payload))]
-
-        if name == "unity_compilation_await":
-            # Async polling approach: wait for compilation to start, then wait for completion
-            # NOTE: We don't require bridge connection here because disconnection during
-            # compilation is expected (Unity domain reload disconnects the bridge).
-            timeout_seconds = args.get("timeoutSeconds", 60)
-            poll_interval = 0.5  # Poll every 500ms
-            poll_timeout = 5.0  # Wait up to 5 seconds for compilation to start
-
-            start_time = time.time()
-            is_compiling = False
-            unity_status: dict[str, Any] = {}
-
-            # Check if bridge is already disconnected (likely compiling)
+@cache
+def _tool_definitions() -> list[types.Tool]:
+    """Tool definitions, built once per process (they are static)."""
+    return get_tool_definitions()
+
+
+async def _handle_ping(args: dict[str, Any]) -> list[types.Content]:
+    """unity_ping: report bridge connectivity and Unity's ping response."""
+    _ensure_bridge_connected()
+    bridge_response = await bridge_manager.send_command("pingUnityEditor", {})
+    payload = {
+        "connected": True,
+        # Read after the round-trip so a heartbeat that arrived meanwhile is reported.
+        "lastHeartbeatAt": bridge_manager.get_last_heartbeat(),
+        "bridgeResponse": bridge_response,
+    }
+    return [types.TextContent(type="text", text=as_pretty_json(payload))]
+
+
+async def _handle_compilation_await(args: dict[str, Any]) -> list[types.Content]:
+    """unity_compilation_await: wait for a triggered compilation to finish."""
+    # Async polling approach: wait for compilation to start, then wait for completion
+    # NOTE: We don't require bridge connection here because disconnection during
+    # compilation is expected (Unity domain reload disconnects the bridge).
+    timeout_seconds = args.get("timeoutSeconds", 60)
+    poll_delay = COMPILE_POLL_INITIAL_SECONDS
+    poll_timeout = 5.0  # Wait up to 5 seconds for compilation to start
+
+    # Monotonic, so a wall-clock adjustment cannot stretch or cut the waits.
+    start_time = time.monotonic()
+    poll_deadline = start_time + poll_timeout
+    is_compiling = False
+    unity_status: dict[str, Any] = {}
+
+    # Check if bridge is already disconnected (likely compiling)
+    if not bridge_manager.is_connected():
+        if bridge_manager.is_compiling():
+            is_compiling = True
+            logger.info("Bridge disconnected but compilation flag set - waiting for reconnection")
+        else:
+            is_compiling = True
+            logger.info(
+                "Bridge disconnected - assuming compilation in progress, waiting for reconnection"
+            )
+
+    # Phase 1: Poll until compilation starts or timeout (only if connected)
+    if not is_compiling:
+        logger.info(
+            "Polling for compilation start (poll_timeout: %.1fs, total_timeout: %ds)...",
+            poll_timeout,
+            timeout_seconds,
+        )
+
+        # Local signals are checked before the deadline, so a compilation:started
+        # or disconnect that ends the last wait is not reported as "no compilation".
+        while True:
+            if bridge_manager.is_compiling():
+                is_compiling = True
+                logger.info("Compilation detected via local state")
+                break
+
             if not bridge_manager.is_connected():
-                if bridge_manager.is_compiling():
+                is_compiling = True
+                logger.info("Bridge disconnected during polling - assuming compilation started")
+                break
+
+            if time.monotonic() >= poll_deadline:
+                break
+
+            try:
+                unity_status = await bridge_manager.send_command(
+                    "compilationAwait", {"operation": "status"}
+                )
+                if unity_status.get("isCompiling", False):
                     is_compiling = True
-                    logger.info(
-                        "Bridge disconnected but compilation flag set - waiting for reconnection"
-                    )
-                else:
+                    logger.info("Compilation detected via Unity query")
+                    break
+            except Exception as exc:
+                logger.debug("Unity query failed (may be compiling): %s", exc)
+                if not bridge_manager.is_connected():
                     is_compiling = True
-                    logger.info(
-                        "Bridge disconnected - assuming compilation in progress, waiting for reconnection"
-                    )
+                    logger.info("Bridge disconnected - assuming compilation started")
+                    break
+
+            # Returns early on compilation:started or a disconnect,
+            # which the checks at the top of the loop then pick up.
+            await bridge_manager.wait_for_compilation_start(poll_delay)
+            poll_delay = min(poll_delay * COMPILE_POLL_BACKOFF, COMPILE_POLL_MAX_SECONDS)
+
+    poll_elapsed = time.monotonic() - start_time
+
+    if not is_compiling:
+        logger.info("No compilation detected after %.1fs polling", poll_elapsed)
+        if unity_status:
+            unity_status["wasCompiling"] = False
+            unity_status["compilationCompleted"] = True
+            unity_status["waitTimeSeconds"] = poll_elapsed
+            unity_status["message"] = "No compilation detected"
+            return _return_with_notification(
+                "unity_compilation_await",
+                [types.TextContent(type="text", text=as_pretty_json(unity_status))],
+            )
+        result = {
+            "wasCompiling": False,
+            "compilationCompleted": True,
+            "waitTimeSeconds": poll_elapsed,
+            "success": True,
+            "errorCount": 0,
+            "message": "No compilation detected",
+        }
+        return _return_with_notification(
+            "unity_compilation_await", [types.TextContent(type="text", text=as_pretty_json(result))]
+        )
+
+    # Phase 2: Compilation in progress - wait for completion asynchronously
+    remaining_timeout = max(1, timeout_seconds - int(poll_elapsed))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Compilation in progress - waiting for completion (timeout: %ds, bridge_connected: %s)...",
+            remaining_timeout,
+            bridge_manager.is_connected(),
+        )
+
+    try:
+        compilation_result = await bridge_manager.await_compilation(remaining_timeout)
+        total_elapsed = time.monotonic() - start_time
+        compilation_result["wasCompiling"] = True
+        compilation_result["compilationCompleted"] = compilation_result.get("completed", True)
+        compilation_result["waitTimeSeconds"] = total_elapsed
+        return _return_with_notification(
+            "unity_compilation_await",
+            [types.TextContent(type="text", text=as_pretty_json(compilation_result))],
+        )
+    except TimeoutError as exc:
+        total_elapsed = time.monotonic() - start_time
+        result = {
+            "wasCompiling": True,
+            "compilationCompleted": False,
+            "waitTimeSeconds": total_elapsed,
+            "success": False,
+            "errorCount": 0,
+            "timedOut": True,
+            "message": str(exc),
+        }
+        return _return_with_notification(
+            "unity_compilation_await", [types.TextContent(type="text", text=as_pretty_json(result))]
+        )
+
+
+async def _handle_asset_crud(args: dict[str, Any]) -> list[types.Content]:
+    """unity_asset_crud: asset operations, waiting for compilation after C# edits."""
+    operation = args.get("operation")
+    asset_path = args.get("assetPath", "")
+    needs_compile = operation in ["create", "update", "delete"] and asset_path.endswith(
+        CS_SCRIPT_SUFFIXES
+    )
+
+    # Register the compilation waiter before the CRUD is sent so that a
+    # compilation which finishes before the response arrives is not missed.
+    compile_task: asyncio.Task[dict[str, Any]] | None = None
+    if needs_compile:
+        compile_task = asyncio.create_task(bridge_manager.await_compilation(timeout_seconds=60))
 
-            # Phase 1: Poll until compilation starts or timeout (only if connected)
-            if not is_compiling:
+    # The response stays a dict until it is returned so compilation results
+    # can be merged without re-parsing.
+    try:
+        asset_response = await _send_bridge_tool("assetManage", args)
+    except BaseException:
+        if compile_task is not None:
+            compile_task.cancel()
+        raise
+
+    if compile_task is not None:
+        logger.info(
+            "C# script %s operation '%s' detected - waiting for compilation to complete...",
+            asset_path,
+            operation,
+        )
+
+        try:
+            compilation_result = await compile_task
+
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    "Polling for compilation start (poll_timeout: %.1fs, total_timeout: %ds)...",
-                    poll_timeout,
-                    timeout_seconds,
+                    "Compilation completed: success=%s, errors=%s, elapsed=%ss",
+                    compilation_result.get("success"),
+                    compilation_result.get("errorCount", 0),
+                    compilation_result.get("elapsedSeconds", 0),
                 )
 
-                while time.time() - start_time < poll_timeout:
-                    if bridge_manager.is_compiling():
-                        is_compiling = True
-                        logger.info("Compilation detected via local state")
-                        break
-
-                    if not bridge_manager.is_connected():
-                        is_compiling = True
-                        logger.info(
-                            "Bridge disconnected during polling - assuming compilation started"
-                        )
-                        break
-
-                    try:
-                        unity_status = await bridge_manager.send_command(
-                            "compilationAwait", {"operation": "status"}
-                        )
-                        if unity_status.get("isCompiling", False):
-                            is_compiling = True
-                            logger.info("Compilation detected via Unity query")
-                            break
-                    except Exception as exc:
-                        logger.debug("Unity query failed (may be compiling): %s", exc)
-                        if not bridge_manager.is_connected():
-                            is_compiling = True
-                            logger.info("Bridge disconnected - assuming compilation started")
-                            break
-
-                    await asyncio.sleep(poll_interval)
-
-            poll_elapsed = time.time() - start_time
-
-            if not is_compiling:
-                logger.info("No compilation detected after %.1fs polling", poll_elapsed)
-                if unity_status:
-                    unity_status["wasCompiling"] = False
-                    unity_status["compilationCompleted"] = True
-                    unity_status["waitTimeSeconds"] = poll_elapsed
-                    unity_status["message"] = "No compilation detected"
-                    return _return_with_notification(
-                        name, [types.TextContent(type="text", text=as_pretty_json(unity_status))]
-                    )
-                result = {
-                    "wasCompiling": False,
-                    "compilationCompleted": True,
-                    "waitTimeSeconds": poll_elapsed,
-                    "success": True,
-                    "errorCount": 0,
-                    "message": "No compilation detected",
-                }
-                return _return_with_notification(
-                    name, [types.TextContent(type="text", text=as_pretty_json(result))]
+            if isinstance(asset_response, dict):
+                asset_response["compilation"] = compilation_result
+            else:
+                asset_response = (
+                    _to_text(asset_response)
+                    + f"\n\nCompilation: {as_pretty_json(compilation_result)}"
                 )
 
-            # Phase 2: Compilation in progress - wait for completion asynchronously
-            remaining_timeout = max(1, timeout_seconds - int(poll_elapsed))
-            logger.info(
-                "Compilation in progress - waiting for completion (timeout: %ds, bridge_connected: %s)...",
-                remaining_timeout,
-                bridge_manager.is_connected(),
-            )
+        except TimeoutError as exc:
+            logger.warning("Compilation wait timed out: %s", exc)
+        except Exception as exc:
+            logger.warning("Error while waiting for compilation: %s", exc)
 
-            try:
-                compilation_result = await bridge_manager.await_compilation(remaining_timeout)
-                total_elapsed = time.time() - start_time
-                compilation_result["wasCompiling"] = True
-                compilation_result["compilationCompleted"] = compilation_result.get(
-                    "completed", True
-                )
-                compilation_result["waitTimeSeconds"] = total_elapsed
-                return _return_with_notification(
-                    name,
-                    [types.TextContent(type="text", text=as_pretty_json(compilation_result))],
-                )
-            except TimeoutError as exc:
-                total_elapsed = time.time() - start_time
-                result = {
-                    "wasCompiling": True,
-                    "compilationCompleted": False,
-                    "waitTimeSeconds": total_elapsed,
-                    "success": False,
-                    "errorCount": 0,
-                    "timedOut": True,
-                    "message": str(exc),
-                }
-                return _return_with_notification(
-                    name, [types.TextContent(type="text", text=as_pretty_json(result))]
-                )
+    return _return_with_notification("unity_asset_crud", _to_content(asset_response))
 
-        if name == "unity_asset_crud":
-            # Handle asset CRUD operations
-            asset_result = await _call_bridge_tool("assetManage", args)
 
-            # Check if we need to wait for compilation (C# script creation/update/deletion)
-            operation = args.get("operation")
-            asset_path = args.get("assetPath", "")
+async def _handle_batch_sequential(args: dict[str, Any]) -> list[types.Content]:
+    """unity_batch_sequential_execute: run operations in order with resume support."""
+    return list(await handle_batch_sequential(args, bridge_manager))
 
-            if operation in ["create", "update", "delete"] and asset_path.lower().endswith(".cs"):
-                logger.info(
-                    "C# script %s operation '%s' detected - waiting for compilation to complete...",
-                    asset_path,
-                    operation,
-                )
 
-                try:
-                    compilation_result = await bridge_manager.await_compilation(timeout_seconds=60)
-
-                    logger.info(
-                        "Compilation completed: success=%s, errors=%s, elapsed=%ss",
-                        compilation_result.get("success"),
-                        compilation_result.get("errorCount", 0),
-                        compilation_result.get("elapsedSeconds", 0),
-                    )
-
-                    first = asset_result[0]
-                    if isinstance(first, types.TextContent):
-                        import json
-
-                        try:
-                            result_data = json.loads(first.text)
-                            result_data["compilation"] = compilation_result
-                            merged_text = as_pretty_json(result_data)
-                        except (json.JSONDecodeError, AttributeError):
-                            merged_text = (
-                                first.text
-                                + f"\n\nCompilation: {as_pretty_json(compilation_result)}"
-                            )
-                        # Create a new TextContent instead of mutating the existing one
-                        asset_result[0] = types.TextContent(type="text", text=merged_text)
-
-                except TimeoutError as exc:
-                    logger.warning("Compilation wait timed out: %s", exc)
-                except Exception as exc:
-                    logger.warning("Error while waiting for compilation: %s", exc)
-
-            return _return_with_notification(name, asset_result)
-
-        if name == "unity_batch_sequential_execute":
-            return list(await handle_batch_sequential(args, bridge_manager))
-
-        # ── Standard bridge tools (dict lookup) ─────────────────────
-        bridge_name = TOOL_NAME_TO_BRIDGE.get(name)
+_Handler = Callable[[dict[str, Any]], Awaitable[list[types.Content]]]
+
+# Tools that need more than a plain _call_bridge_tool dispatch.
+_SPECIAL_HANDLERS: Mapping[str, _Handler] = MappingProxyType(
+    {
+        "unity_ping": _handle_ping,
+        "unity_compilation_await": _handle_compilation_await,
+        "unity_asset_crud": _handle_asset_crud,
+        "unity_batch_sequential_execute": _handle_batch_sequential,
+    }
+)
+
+
+@cache
+def _routes() -> dict[str, tuple[_Handler | None, str | None, Any]]:
+    """Map each defined tool to its handler, bridge command name and input validator.
+
+    One lookup both validates the tool name and yields its dispatch target.
+    """
+    return {
+        tool.name: (
+            _SPECIAL_HANDLERS.get(tool.name),
+            TOOL_NAME_TO_BRIDGE.get(tool.name),
+            jsonschema.validators.validator_for(tool.inputSchema)(tool.inputSchema),
+        )
+        for tool in _tool_definitions()
+    }
+
+
+def _call_tool_decorator(server: Server) -> Any:
+    # mcp's built-in input check runs jsonschema.validate, which re-checks the
+    # schema against its metaschema and builds a new validator on every call;
+    # call_tool validates against the prebuilt validators in _routes instead.
+    try:
+        return server.call_tool(validate_input=False)
+    except TypeError:  # mcp releases that predate the flag do not validate input
+        return server.call_tool()
+
+
+def register_tools(server: Server) -> None:
+    tool_definitions = _tool_definitions()
+    routes = _routes()
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        return tool_definitions
+
+    @_call_tool_decorator(server)
+    async def call_tool(name: str, arguments: dict | None) -> list[types.Content]:
+        try:
+            handler, bridge_name, validator = routes[name]
+        except KeyError:
+            raise RuntimeError(f"Unknown tool requested: {name}") from None
+
+        args = arguments or {}
+
+        error = jsonschema.exceptions.best_match(validator.iter_errors(args))
+        if error is not None:
+            raise RuntimeError(f"Input validation error: {error.message}")
+
+        if handler is not None:
+            return await handler(args)
+
+        # ── Standard bridge tools ───────────────────────────────────
         if bridge_name:
             return _return_with_notification(name, await _call_bridge_tool(bridge_name, args))
 
@@ -8,84 +8,107 @@ never duplicated.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 # MCP tool name → internal Unity bridge handler name.
 # Kept in the same order as CommandHandlerInitializer.cs registrations.
-TOOL_NAME_TO_BRIDGE: dict[str, str] = {
-    # ── Utility ──────────────────────────────────────────────
-    "unity_ping": "pingUnityEditor",
-    "unity_compilation_await": "compilationAwait",
-    # ── Low-Level CRUD ───────────────────────────────────────
-    "unity_scene_crud": "sceneManage",
-    "unity_gameobject_crud": "gameObjectManage",
-    "unity_component_crud": "componentManage",
-    "unity_asset_crud": "assetManage",
-    "unity_scriptableObject_crud": "scriptableObjectManage",
-    "unity_prefab_crud": "prefabManage",
-    "unity_vector_sprite_convert": "vectorSpriteConvert",
-    "unity_projectSettings_crud": "projectSettingsManage",
-    # ── Mid-Level Batch ──────────────────────────────────────
-    "unity_transform_batch": "transformBatch",
-    "unity_rectTransform_batch": "rectTransformBatch",
-    "unity_camera_bundle": "cameraBundle",
-    "unity_ui_foundation": "uiFoundation",
-    "unity_ui_state": "uiState",
-    "unity_ui_navigation": "uiNavigation",
-    "unity_input_profile": "inputProfile",
-    "unity_tilemap_bundle": "tilemapBundle",
-    # ── Mid-Level UI Toolkit ────────────────────────────────
-    "unity_uitk_document": "uitkDocument",
-    "unity_uitk_asset": "uitkAsset",
-    # ── Mid-Level UI Convert ─────────────────────────────
-    "unity_ui_convert": "uiConvert",
-    # ── Mid-Level Visual ────────────────────────────────────
-    "unity_sprite2d_bundle": "sprite2DBundle",
-    "unity_animation_bundle": "animationBundle",
-    # ── Dev-Cycle & Visual ───────────────────────────────────
-    "unity_playmode_control": "playModeControl",
-    "unity_console_log": "consoleLog",
-    "unity_material_bundle": "materialBundle",
-    "unity_light_bundle": "lightBundle",
-    "unity_particle_bundle": "particleBundle",
-    "unity_event_wiring": "eventWiring",
-    # ── Mid-Level Physics & NavMesh ────────────────────────
-    "unity_physics_bundle": "physicsBundle",
-    "unity_navmesh_bundle": "navmeshBundle",
-    # ── High-Level – GameKit UI + Data ──────────────────────────
-    "unity_gamekit_ui": "gamekitUI",
-    "unity_gamekit_data": "gamekitData",
-    # ── High-Level – Logic ────────────────────────────────────
-    "unity_spatial_analysis": "spatialAnalysis",
-    "unity_validate_integrity": "sceneIntegrity",
-    "unity_class_dependency_graph": "classDependencyGraph",
-    "unity_class_catalog": "classCatalog",
-    "unity_scene_reference_graph": "sceneReferenceGraph",
-    "unity_scene_relationship_graph": "sceneRelationshipGraph",
-    "unity_scene_dependency": "sceneDependency",
-    "unity_script_syntax": "scriptSyntax",
-}
+# The tables are read-only: resolve_tool_name caches lookups against them.
+TOOL_NAME_TO_BRIDGE: Mapping[str, str] = MappingProxyType(
+    {
+        # ── Utility ──────────────────────────────────────────────
+        "unity_ping": "pingUnityEditor",
+        "unity_compilation_await": "compilationAwait",
+        # ── Low-Level CRUD ───────────────────────────────────────
+        "unity_scene_crud": "sceneManage",
+        "unity_gameobject_crud": "gameObjectManage",
+        "unity_component_crud": "componentManage",
+        "unity_asset_crud": "assetManage",
+        "unity_scriptableObject_crud": "scriptableObjectManage",
+        "unity_prefab_crud": "prefabManage",
+        "unity_vector_sprite_convert": "vectorSpriteConvert",
+        "unity_projectSettings_crud": "projectSettingsManage",
+        # ── Mid-Level Batch ──────────────────────────────────────
+        "unity_transform_batch": "transformBatch",
+        "unity_rectTransform_batch": "rectTransformBatch",
+        "unity_camera_bundle": "cameraBundle",
+        "unity_ui_foundation": "uiFoundation",
+        "unity_ui_state": "uiState",
+        "unity_ui_navigation": "uiNavigation",
+        "unity_input_profile": "inputProfile",
+        "unity_tilemap_bundle": "tilemapBundle",
+        # ── Mid-Level UI Toolkit ────────────────────────────────
+        "unity_uitk_document": "uitkDocument",
+        "unity_uitk_asset": "uitkAsset",
+        # ── Mid-Level UI Convert ─────────────────────────────
+        "unity_ui_convert": "uiConvert",
+        # ── Mid-Level Visual ────────────────────────────────────
+        "unity_sprite2d_bundle": "sprite2DBundle",
+        "unity_animation_bundle": "animationBundle",
+        # ── Dev-Cycle & Visual ───────────────────────────────────
+        "unity_playmode_control": "playModeControl",
+        "unity_console_log": "consoleLog",
+        "unity_material_bundle": "materialBundle",
+        "unity_light_bundle": "lightBundle",
+        "unity_particle_bundle": "particleBundle",
+        "unity_event_wiring": "eventWiring",
+        # ── Mid-Level Physics & NavMesh ────────────────────────
+        "unity_physics_bundle": "physicsBundle",
+        "unity_navmesh_bundle": "navmeshBundle",
+        # ── High-Level – GameKit UI + Data ──────────────────────────
+        "unity_gamekit_ui": "gamekitUI",
+        "unity_gamekit_data": "gamekitData",
+        # ── High-Level – Logic ────────────────────────────────────
+        "unity_spatial_analysis": "spatialAnalysis",
+        "unity_validate_integrity": "sceneIntegrity",
+        "unity_class_dependency_graph": "classDependencyGraph",
+        "unity_class_catalog": "classCatalog",
+        "unity_scene_reference_graph": "sceneReferenceGraph",
+        "unity_scene_relationship_graph": "sceneRelationshipGraph",
+        "unity_scene_dependency": "sceneDependency",
+        "unity_script_syntax": "scriptSyntax",
+    }
+)
 
 # Reverse mapping: bridge name → MCP tool name.
-BRIDGE_TO_TOOL_NAME: dict[str, str] = {v: k for k, v in TOOL_NAME_TO_BRIDGE.items()}
+BRIDGE_TO_TOOL_NAME: Mapping[str, str] = MappingProxyType(
+    {v: k for k, v in TOOL_NAME_TO_BRIDGE.items()}
+)
 
 # Tools that require special handling in register_tools.py and are NOT
 # simple ``_call_bridge_tool(bridge_name, args)`` dispatches.
-SPECIAL_TOOLS: set[str] = {
-    "unity_ping",
-    "unity_compilation_await",
-    "unity_asset_crud",
-    "unity_batch_sequential_execute",
-}
+SPECIAL_TOOLS: frozenset[str] = frozenset(
+    {
+        "unity_ping",
+        "unity_compilation_await",
+        "unity_asset_crud",
+        "unity_batch_sequential_execute",
+    }
+)
+
+# Every casing of the C# script extension; ``str.endswith`` with this tuple
+# matches case-insensitively without lowering the whole asset path.
+CS_SCRIPT_SUFFIXES: tuple[str, ...] = (".cs", ".cS", ".Cs", ".CS")
+
+
+# Sorted MCP tool names for the resolve_tool_name error message.
+_AVAILABLE_TOOLS_TEXT = ", ".join(sorted(TOOL_NAME_TO_BRIDGE))
 
 
+@lru_cache(maxsize=256)
 def resolve_tool_name(tool_name: str) -> str:
     """Resolve an MCP tool name to its internal bridge tool name.
 
     Accepts either an MCP name (``unity_gameobject_crud``) or a bridge name
     already (``gameObjectManage``).  Raises ``ValueError`` for unknown names.
+    Results are cached (the mappings are static); failures are not, since
+    ``lru_cache`` never stores exceptions.
     """
     # MCP name → bridge name
-    if tool_name in TOOL_NAME_TO_BRIDGE:
-        return TOOL_NAME_TO_BRIDGE[tool_name]
+    bridge_name = TOOL_NAME_TO_BRIDGE.get(tool_name)
+    if bridge_name is not None:
+        return bridge_name
 
     # Already a bridge name
     if tool_name in BRIDGE_TO_TOOL_NAME:
@@ -94,5 +117,5 @@ def resolve_tool_name(tool_name: str) -> str:
     raise ValueError(
         f"Unsupported tool name: {tool_name}. "
         f"Use MCP names (e.g., 'unity_gameobject_crud') or internal names (e.g., 'gameObjectManage'). "
-        f"Available tools: {', '.join(sorted(TOOL_NAME_TO_BRIDGE.keys()))}"
+        f"Available tools: {_AVAILABLE_TOOLS_TEXT}"
     )
@@ -8,3 +8,15 @@ def path_exists(target_path: Path) -> bool:
         return target_path.exists()
     except OSError:
         return False
+
+
+def read_utf8_text(target_path: Path) -> str:
+    """Read a UTF-8 text file with universal newlines, like ``Path.read_text``.
+
+    Reading the bytes and decoding them in one call skips the text I/O layer,
+    which roughly halves the cost for the multi-KB prompt files.
+    """
+    content = target_path.read_bytes().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
@@ -1,7 +1,57 @@
 from __future__ import annotations
 
 import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+_PRETTY_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
 
 
 def as_pretty_json(value: object) -> str:
+    """Serialize *value* as 2-space indented JSON text, using orjson when installed.
+
+    Values orjson cannot encode (arbitrarily large ints, for example) fall back
+    to the stdlib encoder, which produces the same layout.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=_PRETTY_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
     return json.dumps(value, ensure_ascii=False, indent=2)
+
+
+def as_json_bytes(value: object) -> bytes:
+    """Serialize *value* to compact UTF-8 JSON, using orjson when installed.
+
+    Values orjson cannot encode fall back to the stdlib encoder, as in
+    :func:`as_pretty_json`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def parse_json(data: bytes | str) -> Any:
+    """Parse a JSON document from bytes or str, using orjson when installed.
+
+    Raises:
+        json.JSONDecodeError: If *data* is not valid JSON, including bytes that are
+            not valid UTF-8 (``orjson.JSONDecodeError`` is a subclass, so callers can
+            catch the stdlib type either way).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as exc:
+        raise json.JSONDecodeError(
+            f"Invalid UTF-8: {exc.reason}", exc.object.decode("utf-8", "replace"), exc.start
+        ) from exc
@@ -98,6 +98,123 @@ class TestBatchQueueState:
             assert state.last_error is None
             assert not temp_state_file.exists()
 
+    def test_progress_log_replayed_on_load(self, tmp_path: Path) -> None:
+        from tools.batch_sequential import BatchQueueState
+
+        temp_state_file = tmp_path / ".batch_queue_state.json"
+        wal_file = tmp_path / ".batch_queue_state.wal"
+
+        with patch("tools.batch_sequential.STATE_FILE", temp_state_file):
+            state = BatchQueueState()
+            state.operations = [{"tool": "unity_ping", "arguments": {}}] * 3
+            state._save_to_file()
+
+            state.current_index = 1
+            state._append_progress()
+            state.current_index = 2
+            state.last_error = "boom"
+            state.last_error_index = 2
+            state._append_progress()
+
+            # A partial trailing line from an interrupted append is ignored
+            with open(wal_file, "a", encoding="utf-8") as f:
+                f.write('{"current_index":')
+
+            loaded = BatchQueueState._load_from_file()
+            assert loaded.operations == state.operations
+            assert loaded.current_index == 2
+            assert loaded.last_error == "boom"
+            assert loaded.last_error_index == 2
+
+    def test_progress_log_compacted_into_snapshot(self, tmp_path: Path) -> None:
+        from tools.batch_sequential import BatchQueueState
+
+        temp_state_file = tmp_path / ".batch_queue_state.json"
+        wal_file = tmp_path / ".batch_queue_state.wal"
+
+        with (
+            patch("tools.batch_sequential.STATE_FILE", temp_state_file),
+            patch("tools.batch_sequential.WAL_COMPACT_BYTES", 64),
+        ):
+            state = BatchQueueState()
+            state.operations = [{"tool": "unity_ping", "arguments": {}}] * 10
+            state._save_to_file()
+
+            for index in range(1, 6):
+                state.current_index = index
+                state._append_progress()
+
+            assert json.loads(temp_state_file.read_text())["current_index"] > 0
+            assert BatchQueueState._load_from_file().current_index == 5
+
+            state._clear()
+            assert not wal_file.exists()
+
+    def test_progress_log_from_other_batch_ignored(self, tmp_path: Path) -> None:
+        from tools.batch_sequential import BatchQueueState
+
+        temp_state_file = tmp_path / ".batch_queue_state.json"
+        wal_file = tmp_path / ".batch_queue_state.wal"
+
+        with patch("tools.batch_sequential.STATE_FILE", temp_state_file):
+            state = BatchQueueState()
+            state.operations = [{"tool": "unity_ping", "arguments": {}}] * 3
+            state.started_at = "2025-01-01T00:00:00"
+            state._save_to_file()
+            wal_file.write_text('{"current_index":2,"started_at":"2024-12-31T00:00:00"}\n')
+
+            assert BatchQueueState._load_from_file().current_index == 0
+
+    def test_save_leaves_previous_snapshot_on_failure(self, tmp_path: Path) -> None:
+        from tools.batch_sequential import BatchQueueState
+
+        temp_state_file = tmp_path / ".batch_queue_state.json"
+
+        with patch("tools.batch_sequential.STATE_FILE", temp_state_file):
+            state = BatchQueueState()
+            state.operations = [{"tool": "unity_ping", "arguments": {}}]
+            state._save_to_file()
+            before = temp_state_file.read_bytes()
+
+            state.current_index = 1
+            with patch("tools.batch_sequential.os.replace", side_effect=OSError("disk full")):
+                state._save_to_file()
+
+            assert temp_state_file.read_bytes() == before
+            assert list(tmp_path.iterdir()) == [temp_state_file]
+
+    def test_save_removes_temp_file_when_encoding_fails(self, tmp_path: Path) -> None:
+        from tools.batch_sequential import BatchQueueState
+
+        temp_state_file = tmp_path / ".batch_queue_state.json"
+
+        with patch("tools.batch_sequential.STATE_FILE", temp_state_file):
+            state = BatchQueueState()
+            with (
+                patch("tools.batch_sequential.as_json_bytes", side_effect=TypeError("boom")),
+                pytest.raises(TypeError),
+            ):
+                state._save_to_file()
+
+            assert list(tmp_path.iterdir()) == []
+
+    def test_save_and_load_large_int_arguments(self, tmp_path: Path) -> None:
+        from tools.batch_sequential import BatchQueueState
+
+        temp_state_file = tmp_path / ".batch_queue_state.json"
+
+        with patch("tools.batch_sequential.STATE_FILE", temp_state_file):
+            state = BatchQueueState()
+            state.operations = [{"tool": "unity_scene_crud", "arguments": {"n": 2**70}}]
+            state._save_to_file()
+            state.current_index = 1
+            state._append_progress()
+
+            loaded = BatchQueueState._load_from_file()
+
+        assert loaded.operations == state.operations
+        assert loaded.current_index == 1
+
 
 class TestBatchQueueManager:
     """Tests for BatchQueueManager class."""
@@ -112,6 +229,30 @@ class TestBatchQueueManager:
             assert manager.state is not None
             assert manager.lock is not None
 
+    @pytest.mark.asyncio
+    async def test_persisted_state_loaded_on_first_use(self, tmp_path: Path) -> None:
+        from tools.batch_sequential import BatchQueueManager, BatchQueueState
+
+        temp_state_file = tmp_path / ".batch_queue_state.json"
+
+        with patch("tools.batch_sequential.STATE_FILE", temp_state_file):
+            saved = BatchQueueState()
+            saved.operations = [{"tool": "unity_ping", "arguments": {}}]
+            saved._save_to_file()
+
+            with patch.object(
+                BatchQueueState, "_load_from_file", wraps=BatchQueueState._load_from_file
+            ) as load:
+                manager = BatchQueueManager()
+                load.assert_not_called()
+
+                async with manager.lock:
+                    await manager.load_async()
+                    await manager.load_async()
+
+            load.assert_called_once()
+            assert manager.state.operations == saved.operations
+
     def test_lock_is_asyncio_lock(self, tmp_path: Path) -> None:
         from tools.batch_sequential import BatchQueueManager
 
@@ -139,6 +280,38 @@ class TestBatchQueueManager:
             async with manager.lock:
                 assert manager.state.operations == [{"tool": "test", "arguments": {}}]
 
+    @pytest.mark.asyncio
+    async def test_async_persistence_runs_in_worker_thread(self, tmp_path: Path) -> None:
+        import threading
+
+        from tools.batch_sequential import BatchQueueManager, BatchQueueState
+
+        temp_state_file = tmp_path / ".batch_queue_state.json"
+        writer_threads: list[threading.Thread] = []
+        original_save = BatchQueueState._save_to_file
+
+        def recording_save(state: BatchQueueState) -> None:
+            writer_threads.append(threading.current_thread())
+            original_save(state)
+
+        with (
+            patch("tools.batch_sequential.STATE_FILE", temp_state_file),
+            patch.object(BatchQueueState, "_save_to_file", recording_save),
+        ):
+            manager = BatchQueueManager()
+
+            async with manager.lock:
+                manager.state.operations = [{"tool": "test", "arguments": {}}]
+                await manager.save_async()
+
+            assert temp_state_file.exists()
+            assert writer_threads and writer_threads[0] is not threading.main_thread()
+
+            async with manager.lock:
+                await manager.clear_async()
+
+            assert not temp_state_file.exists()
+
 
 class TestExecuteBatchSequential:
     """Tests for execute_batch_sequential function."""
@@ -171,6 +344,31 @@ class TestExecuteBatchSequential:
             assert len(result["completed"]) == 1
             assert len(result["errors"]) == 0
 
+    @pytest.mark.asyncio
+    async def test_execute_skips_progress_write_for_last_operation(
+        self, mock_bridge_manager: MagicMock, tmp_path: Path
+    ) -> None:
+        from tools.batch_sequential import BatchQueueState, execute_batch_sequential
+
+        temp_state_file = tmp_path / ".batch_queue_state.json"
+
+        with (
+            patch("tools.batch_sequential.STATE_FILE", temp_state_file),
+            patch.object(BatchQueueState, "_append_progress") as append_progress,
+        ):
+            from tools import batch_sequential
+
+            batch_sequential._batch_manager = batch_sequential.BatchQueueManager()
+
+            result = await execute_batch_sequential(
+                bridge_client=mock_bridge_manager,
+                operations=[{"tool": "unity_ping", "arguments": {}}] * 3,
+            )
+
+            assert result["success"] is True
+            assert append_progress.call_count == 2
+            assert not temp_state_file.exists()
+
     @pytest.mark.asyncio
     async def test_execute_stops_on_error(
         self, mock_bridge_manager: MagicMock, tmp_path: Path
@@ -211,6 +409,34 @@ class TestExecuteBatchSequential:
             assert len(result["completed"]) == 1
             assert len(result["errors"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_execute_stops_on_invalid_tool_name(
+        self, mock_bridge_manager: MagicMock, tmp_path: Path
+    ) -> None:
+        from tools.batch_sequential import execute_batch_sequential
+
+        temp_state_file = tmp_path / ".batch_queue_state.json"
+
+        with patch("tools.batch_sequential.STATE_FILE", temp_state_file):
+            from tools import batch_sequential
+
+            batch_sequential._batch_manager = batch_sequential.BatchQueueManager()
+
+            result = await execute_batch_sequential(
+                bridge_client=mock_bridge_manager,
+                operations=[
+                    {"tool": "unity_ping", "arguments": {}},
+                    {"tool": "not_a_tool", "arguments": {}},
+                ],
+            )
+
+            assert result["stopped_at_index"] == 1
+            assert result["remaining_operations"] == 1
+            assert result["message"] == (
+                "Execution stopped at operation 2 due to invalid tool name."
+            )
+            assert "Unsupported tool name" in result["last_error"]
+
     @pytest.mark.asyncio
     async def test_execute_resume(
         self, mock_bridge_manager: MagicMock, tmp_path: Path
@@ -294,6 +520,48 @@ class TestExecuteBatchSequential:
             assert result["errors"][0]["exception"] is True
 
 
+    @pytest.mark.asyncio
+    async def test_concurrent_batch_rejected_while_running(
+        self, mock_bridge_manager: MagicMock, tmp_path: Path
+    ) -> None:
+        from tools.batch_sequential import execute_batch_sequential
+
+        temp_state_file = tmp_path / ".batch_queue_state.json"
+        release = asyncio.Event()
+
+        async def slow_send(*_: Any, **__: Any) -> dict[str, Any]:
+            await release.wait()
+            return {"success": True, "result": {}}
+
+        mock_bridge_manager.send_command = AsyncMock(side_effect=slow_send)
+
+        with patch("tools.batch_sequential.STATE_FILE", temp_state_file):
+            from tools import batch_sequential
+
+            batch_sequential._batch_manager = batch_sequential.BatchQueueManager()
+
+            first = asyncio.create_task(
+                execute_batch_sequential(
+                    bridge_client=mock_bridge_manager,
+                    operations=[{"tool": "unity_ping", "arguments": {}}],
+                )
+            )
+            while not mock_bridge_manager.send_command.await_count:
+                await asyncio.sleep(0)
+
+            second = await execute_batch_sequential(
+                bridge_client=mock_bridge_manager,
+                operations=[{"tool": "unity_scene_crud", "arguments": {}}],
+            )
+            assert second["success"] is False
+            assert "already running" in second["message"]
+
+            release.set()
+            result = await first
+            assert result["success"] is True
+            assert batch_sequential._batch_manager.running is False
+
+
 class TestAutoCompilationInjection:
     """Tests for auto-compilation wait injection in batch execution."""
 
@@ -458,6 +726,27 @@ class TestHandleBatchSequential:
         assert content["success"] is False
         assert "No operations provided" in content["error"]
 
+    @pytest.mark.asyncio
+    async def test_handle_rejects_malformed_operation(
+        self, mock_bridge_manager: MagicMock
+    ) -> None:
+        from tools.batch_sequential import handle_batch_sequential
+
+        result = await handle_batch_sequential(
+            arguments={
+                "operations": [
+                    {"tool": "unity_ping", "arguments": {}},
+                    {"tool": "unity_scene_crud", "arguments": "inspect"},
+                ],
+            },
+            bridge_client=mock_bridge_manager,
+        )
+
+        content = json.loads(result[0].text)
+        assert content["success"] is False
+        assert content["error"].startswith("Operation 2 ")
+        mock_bridge_manager.send_command.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handle_with_operations(
         self, mock_bridge_manager: MagicMock, tmp_path: Path
@@ -146,6 +146,89 @@ class TestBridgeManagerAsync:
         assert manager._socket is mock_websocket
         assert manager._last_heartbeat_at is not None
 
+    @pytest.mark.asyncio
+    async def test_receive_loop_parses_bytes_frames(self, mock_websocket: MagicMock) -> None:
+        from websockets.exceptions import ConnectionClosedOK
+
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+        context_handler = MagicMock()
+        manager._message_handlers["context:update"] = context_handler
+        mock_websocket.recv = AsyncMock(
+            side_effect=[
+                b'{"type":"context:update","payload":{"updatedAt":1234}}',
+                b"not json",
+                ConnectionClosedOK(None, None),
+            ]
+        )
+
+        await manager._receive_loop(mock_websocket)
+
+        mock_websocket.recv.assert_called_with(decode=False)
+        assert mock_websocket.recv.call_count == 3
+        context_handler.assert_called_once_with(
+            {"type": "context:update", "payload": {"updatedAt": 1234}}
+        )
+        assert manager._socket is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_receive_loop_skips_non_utf8_frames(
+        self, mock_websocket: MagicMock, use_orjson: bool
+    ) -> None:
+        from websockets.exceptions import ConnectionClosedOK
+
+        from bridge.bridge_manager import BridgeManager
+        from utils import json_utils
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+        context_handler = MagicMock()
+        manager._message_handlers["context:update"] = context_handler
+        mock_websocket.recv = AsyncMock(
+            side_effect=[
+                b'{"type":"context:update","payload":"\xff\xfe"}',
+                b'{"type":"context:update","payload":{}}',
+                ConnectionClosedOK(None, None),
+            ]
+        )
+
+        orjson = json_utils.orjson if use_orjson else None
+        with patch.object(json_utils, "orjson", orjson):
+            await manager._receive_loop(mock_websocket)
+
+        assert mock_websocket.recv.call_count == 3
+        context_handler.assert_called_once_with({"type": "context:update", "payload": {}})
+
+    @pytest.mark.asyncio
+    async def test_receive_loop_heartbeat_fast_path(self, mock_websocket: MagicMock) -> None:
+        from websockets.exceptions import ConnectionClosedOK
+
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+        seen: list[int | None] = []
+        manager._message_handlers["context:update"] = lambda _: seen.append(
+            manager._last_heartbeat_at
+        )
+        mock_websocket.recv = AsyncMock(
+            side_effect=[
+                b'{"type":"heartbeat","timestamp":1700000000123}',
+                b'{"type":"context:update","payload":{}}',
+                b'{"type":"heartbeat","timestamp":1700000000456, "extra": 1}',
+                b'{"type":"context:update","payload":{}}',
+                ConnectionClosedOK(None, None),
+            ]
+        )
+
+        await manager._receive_loop(mock_websocket)
+
+        # The second heartbeat does not match the fast path and is fully parsed
+        assert seen == [1700000000123, 1700000000456]
+
     @pytest.mark.asyncio
     async def test_send_command_raises_when_not_connected(self) -> None:
         from bridge.bridge_manager import BridgeManager
@@ -167,7 +250,6 @@ class TestBridgeManagerAsync:
             await asyncio.sleep(0.01)
             # Find the pending command and resolve it
             for cmd_id, pending in list(manager._pending_commands.items()):
-                pending.timeout_handle.cancel()
                 pending.future.set_result({"success": True})
                 break
 
@@ -178,6 +260,21 @@ class TestBridgeManagerAsync:
         assert result == {"success": True}
         mock_websocket.send.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_send_command_ids_are_unique(self, mock_websocket: MagicMock) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+
+        for _ in range(3):
+            with pytest.raises(TimeoutError):
+                await manager.send_command("test_tool", {}, timeout_ms=1)
+
+        sent_ids = [json.loads(call[0][0])["commandId"] for call in mock_websocket.send.call_args_list]
+        assert len(set(sent_ids)) == 3
+        assert all(command_id.startswith(manager._command_id_prefix) for command_id in sent_ids)
+
     @pytest.mark.asyncio
     async def test_send_command_timeout(self, mock_websocket: MagicMock) -> None:
         from bridge.bridge_manager import BridgeManager
@@ -188,6 +285,20 @@ class TestBridgeManagerAsync:
         with pytest.raises(TimeoutError, match="timed out"):
             await manager.send_command("test_tool", {}, timeout_ms=10)
 
+    @pytest.mark.asyncio
+    async def test_timeout_sweeper_stops_when_idle(self, mock_websocket: MagicMock) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+
+        with pytest.raises(TimeoutError):
+            await manager.send_command("test_tool", {}, timeout_ms=10)
+        await asyncio.sleep(0.15)
+
+        assert manager._pending_commands == {}
+        assert manager._timeout_task is None
+
     @pytest.mark.asyncio
     async def test_send_ping(self, mock_websocket: MagicMock) -> None:
         from bridge.bridge_manager import BridgeManager
@@ -211,6 +322,51 @@ class TestBridgeManagerAsync:
         # Should not raise
         await manager.send_ping()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_are_written_in_order(
+        self, mock_websocket: MagicMock
+    ) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+        written: list[int] = []
+
+        async def slow_send(data: Any, *args: Any, **kwargs: Any) -> None:
+            # Yield mid-write so the other senders really contend for the socket.
+            await asyncio.sleep(0)
+            written.append(json.loads(data)["seq"])
+
+        mock_websocket.send = AsyncMock(side_effect=slow_send)
+
+        with patch.object(manager, "_writer_loop", wraps=manager._writer_loop) as writer_loop:
+            await asyncio.gather(
+                *(manager._send_json(mock_websocket, {"type": "ping", "seq": i}) for i in range(5))
+            )
+
+        writer_loop.assert_called_once()
+        assert written == [0, 1, 2, 3, 4]
+        assert manager._writer_task is None
+        assert manager._writer_busy is False
+        assert not manager._send_queue
+
+    @pytest.mark.asyncio
+    async def test_send_raises_when_socket_closed_mid_send(
+        self, mock_websocket: MagicMock
+    ) -> None:
+        from websockets.exceptions import ConnectionClosed
+
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+        mock_websocket.send.side_effect = ConnectionClosed(None, None)
+
+        with pytest.raises(RuntimeError, match="Unity bridge is not connected"):
+            await manager.send_ping()
+
+        assert manager._socket is None
+
     @pytest.mark.asyncio
     async def test_await_compilation_raises_when_not_connected(self) -> None:
         from bridge.bridge_manager import BridgeManager
@@ -232,6 +388,59 @@ class TestBridgeManagerAsync:
         with pytest.raises(TimeoutError, match="Compilation did not complete"):
             await manager.await_compilation(timeout_seconds=0.01)
 
+    @pytest.mark.asyncio
+    async def test_cancelled_await_compilation_removes_waiter(
+        self, mock_websocket: MagicMock
+    ) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+
+        task = asyncio.create_task(manager.await_compilation(timeout_seconds=30))
+        await asyncio.sleep(0)
+        assert len(manager._compilation_waiters) == 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert manager._compilation_waiters == []
+
+    @pytest.mark.asyncio
+    async def test_wait_for_compilation_start_wakes_on_started(
+        self, mock_websocket: MagicMock
+    ) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+
+        waiter = asyncio.create_task(manager.wait_for_compilation_start(30))
+        await asyncio.sleep(0)
+        manager._handle_compilation_started({"timestamp": 1})
+
+        assert await asyncio.wait_for(waiter, 1) is True
+        assert manager._compilation_start_waiters == []
+
+    @pytest.mark.asyncio
+    async def test_wait_for_compilation_start_times_out(self, mock_websocket: MagicMock) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+
+        assert await manager.wait_for_compilation_start(0.01) is False
+        assert manager._compilation_start_waiters == []
+
+    @pytest.mark.asyncio
+    async def test_wait_for_compilation_start_when_disconnected(self) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+
+        assert await manager.wait_for_compilation_start(30) is True
+
 
 class TestBridgeManagerMessageHandling:
     """Tests for message handling in BridgeManager."""
@@ -297,12 +506,11 @@ class TestBridgeManagerMessageHandling:
 
         try:
             future: asyncio.Future[Any] = loop.create_future()
-            timeout_handle = MagicMock()
-
             manager._pending_commands["cmd-123"] = PendingCommand(
                 tool_name="test_tool",
                 future=future,
-                timeout_handle=timeout_handle,
+                deadline=loop.time() + 30,
+                timeout_ms=30_000,
             )
 
             message = {
@@ -314,7 +522,6 @@ class TestBridgeManagerMessageHandling:
 
             manager._handle_command_result(message)
 
-            timeout_handle.cancel.assert_called_once()
             assert future.done()
             assert future.result() == {"data": "test"}
             assert "cmd-123" not in manager._pending_commands
@@ -330,12 +537,11 @@ class TestBridgeManagerMessageHandling:
 
         try:
             future: asyncio.Future[Any] = loop.create_future()
-            timeout_handle = MagicMock()
-
             manager._pending_commands["cmd-456"] = PendingCommand(
                 tool_name="test_tool",
                 future=future,
-                timeout_handle=timeout_handle,
+                deadline=loop.time() + 30,
+                timeout_ms=30_000,
             )
 
             message = {
@@ -347,7 +553,6 @@ class TestBridgeManagerMessageHandling:
 
             manager._handle_command_result(message)
 
-            timeout_handle.cancel.assert_called_once()
             assert future.done()
 
             with pytest.raises(RuntimeError, match="Operation failed"):
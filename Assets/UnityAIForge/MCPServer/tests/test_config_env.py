@@ -6,7 +6,7 @@ import json
 import os
 from pathlib import Path
 from typing import Generator
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -200,3 +200,50 @@ class TestCliOverrides:
         assert env._cli_bridge_token == "only-token"
         assert env._cli_bridge_host is None
         assert env._cli_bridge_port is None
+
+
+class TestEnvProxy:
+    """Tests for _EnvProxy attribute caching."""
+
+    def test_resolves_once_then_caches(self) -> None:
+        from config import env
+
+        proxy = env._EnvProxy()
+        fake_env = MagicMock(bridge_token="cached-token")
+
+        with patch.object(env, "_get_env", return_value=fake_env) as get_env:
+            assert proxy.bridge_token == "cached-token"
+            assert proxy.bridge_token == "cached-token"
+
+        get_env.assert_called_once()
+
+
+class TestServerEnv:
+    """Tests for derived ServerEnv fields."""
+
+    @staticmethod
+    def _make_env(bridge_token: str | None):
+        from config.env import ServerEnv
+
+        return ServerEnv(
+            port=6007,
+            host="127.0.0.1",
+            log_level="info",
+            unity_project_root=Path("."),
+            unity_editor_log_path=Path("Editor.log"),
+            enable_file_watcher=False,
+            unity_bridge_host="127.0.0.1",
+            unity_bridge_port=7070,
+            bridge_reconnect_ms=5000,
+            bridge_token=bridge_token,
+            notification_mode="compilation",
+        )
+
+    def test_bridge_token_masked_shows_last_four(self) -> None:
+        assert self._make_env("secret-token-1234").bridge_token_masked == "****1234"
+
+    def test_bridge_token_masked_short_token(self) -> None:
+        assert self._make_env("abcd").bridge_token_masked == "set"
+
+    def test_bridge_token_masked_no_token(self) -> None:
+        assert self._make_env(None).bridge_token_masked == "not set"
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from unittest.mock import patch
 
+import pytest
+
 import server.create_mcp_server as _mod
 
 
 class TestCreateMcpServer:
     """Tests for create_mcp_server factory function."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_server(self) -> Generator[None, None, None]:
+        _mod.create_mcp_server.cache_clear()
+        yield
+        _mod.create_mcp_server.cache_clear()
+
+    def test_returns_same_instance_on_repeat_calls(self) -> None:
+        with patch.object(_mod, "register_tools") as mock_register:
+            first = _mod.create_mcp_server()
+            assert _mod.create_mcp_server() is first
+            mock_register.assert_called_once_with(first)
+
     def test_returns_server_instance(self) -> None:
         server = _mod.create_mcp_server()
         assert server is not None
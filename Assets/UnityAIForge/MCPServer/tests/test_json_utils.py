@@ -0,0 +1,41 @@
+"""Tests for utils/json_utils.py module."""
+
+from __future__ import annotations
+
+import json
+
+
+class TestAsPrettyJson:
+    """Tests for as_pretty_json."""
+
+    def test_matches_stdlib_layout(self) -> None:
+        from utils.json_utils import as_pretty_json
+
+        value = {"name": "Café", "items": [1, 2.5, None, True], "empty": {}, "list": []}
+        assert as_pretty_json(value) == json.dumps(value, ensure_ascii=False, indent=2)
+
+    def test_non_string_keys(self) -> None:
+        from utils.json_utils import as_pretty_json
+
+        assert as_pretty_json({1: "a"}) == '{\n  "1": "a"\n}'
+
+    def test_falls_back_for_values_orjson_rejects(self) -> None:
+        from utils.json_utils import as_pretty_json
+
+        assert json.loads(as_pretty_json({"big": 2**70})) == {"big": 2**70}
+
+
+class TestAsJsonBytes:
+    """Tests for as_json_bytes."""
+
+    def test_compact_utf8(self) -> None:
+        from utils.json_utils import as_json_bytes
+
+        assert as_json_bytes({"name": "Café", "items": [1, None]}) == (
+            '{"name":"Café","items":[1,null]}'.encode()
+        )
+
+    def test_falls_back_for_values_orjson_rejects(self) -> None:
+        from utils.json_utils import as_json_bytes
+
+        assert json.loads(as_json_bytes({"big": 2**70})) == {"big": 2**70}
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 
 class TestComputeProjectHash:
@@ -77,6 +78,28 @@ class TestIsProcessAlive:
         # PID 999999999 almost certainly doesn't exist
         assert _is_process_alive(999999999) is False
 
+    def test_signal_fallback_matches(self) -> None:
+        from config.port_discovery import _is_process_alive_signal
+
+        assert _is_process_alive_signal(os.getpid()) is True
+        assert _is_process_alive_signal(999999999) is False
+
+    def test_procfs_hidden_process_falls_back_to_signal(self) -> None:
+        from config.port_discovery import _is_process_alive_procfs
+
+        # /proc mounted with hidepid=2 hides other users' processes
+        with (
+            patch("config.port_discovery.os.path.exists", return_value=False),
+            patch("config.port_discovery.os.kill", side_effect=PermissionError),
+        ):
+            assert _is_process_alive_procfs(4242) is True
+
+        with (
+            patch("config.port_discovery.os.path.exists", return_value=False),
+            patch("config.port_discovery.os.kill", side_effect=ProcessLookupError),
+        ):
+            assert _is_process_alive_procfs(4242) is False
+
 
 class TestDiscoverBridgePort:
     """Tests for discover_bridge_port function."""
@@ -118,6 +141,31 @@ class TestDiscoverBridgePort:
             if port_file.exists():
                 port_file.unlink()
 
+    def test_file_with_utf8_bom_returns_port(self, tmp_path: Path) -> None:
+        from config.port_discovery import (
+            _compute_project_hash,
+            _get_discovery_directory,
+            discover_bridge_port,
+        )
+
+        project = tmp_path / "BomProject"
+        project.mkdir()
+
+        project_hash = _compute_project_hash(project)
+        discovery_dir = _get_discovery_directory()
+        discovery_dir.mkdir(parents=True, exist_ok=True)
+        port_file = discovery_dir / f"{project_hash}.port"
+
+        try:
+            data = {"port": 7072, "pid": os.getpid()}
+            port_file.write_text(json.dumps(data), encoding="utf-8-sig")
+
+            result = discover_bridge_port(project)
+            assert result == 7072
+        finally:
+            if port_file.exists():
+                port_file.unlink()
+
     def test_stale_pid_returns_none_and_deletes_file(self, tmp_path: Path) -> None:
         from config.port_discovery import (
             _compute_project_hash,
@@ -58,12 +58,12 @@ class TestPromptDefinitions:
     def test_template_map_covers_all_options(self) -> None:
         """Every (prompt_name, option) pair must have a template path."""
         expected_count = len(GENRE_OPTIONS) + len(MECHANIC_OPTIONS) + len(WORKFLOW_OPTIONS)
-        assert len(PROMPT_TEMPLATE_MAP) == expected_count
+        assert sum(len(templates) for templates in PROMPT_TEMPLATE_MAP.values()) == expected_count
 
     def test_template_map_keys_match_valid_values(self) -> None:
         for prompt_name, valid_values in PROMPT_VALID_VALUES.items():
             for value in valid_values:
-                assert (prompt_name, value) in PROMPT_TEMPLATE_MAP
+                assert value in PROMPT_TEMPLATE_MAP[prompt_name]
 
     def test_arg_name_map_covers_all_prompts(self) -> None:
         for prompt in PROMPT_DEFINITIONS:
@@ -92,6 +92,18 @@ class TestTemplateLoader:
         with pytest.raises(FileNotFoundError, match="テンプレートファイルが見つかりません"):
             load_prompt_template("nonexistent/missing.md")
 
+    def test_load_template_is_cached(self) -> None:
+        first = load_prompt_template("genre/puzzle.md")
+        assert load_prompt_template("genre/puzzle.md") is first
+
+    def test_crlf_template_is_normalized(self, tmp_path) -> None:
+        from utils.fs_utils import read_utf8_text
+
+        path = tmp_path / "crlf.md"
+        path.write_bytes("# 見出し\r\nline\rend\r\n".encode())
+
+        assert read_utf8_text(path) == path.read_text(encoding="utf-8")
+
     def test_version_replacement(self) -> None:
         content = load_prompt_template("genre/platformer_2d.md")
         assert "{VERSION}" not in content
@@ -110,9 +122,12 @@ class TestTemplateLoader:
 
     def test_all_template_map_files_exist(self) -> None:
         """Every path in PROMPT_TEMPLATE_MAP must correspond to an existing file."""
-        for key, relative_path in PROMPT_TEMPLATE_MAP.items():
-            full_path = TEMPLATES_DIR / relative_path
-            assert full_path.exists(), f"Missing template: {relative_path} (for {key})"
+        for prompt_name, templates in PROMPT_TEMPLATE_MAP.items():
+            for value, relative_path in templates.items():
+                full_path = TEMPLATES_DIR / relative_path
+                assert (
+                    full_path.exists()
+                ), f"Missing template: {relative_path} (for {prompt_name}/{value})"
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,47 @@
+"""Tests for resources/register_resources.py module."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from mcp import types as mcp_types
+from mcp.server import Server
+
+from resources.register_resources import register_resources
+
+
+@pytest.fixture
+def server() -> Server:
+    server = Server("test")
+    register_resources(server)
+    return server
+
+
+class TestRegisterResources:
+    """Tests for the registered resource handlers."""
+
+    async def test_list_resources(self, server: Server) -> None:
+        handler = server.request_handlers[mcp_types.ListResourcesRequest]
+        result = await handler(mcp_types.ListResourcesRequest(method="resources/list"))
+        uris = [str(resource.uri) for resource in result.root.resources]
+        assert uris == ["batch://queue/status"]
+
+    async def test_read_batch_queue_status(self, server: Server) -> None:
+        handler = server.request_handlers[mcp_types.ReadResourceRequest]
+        request = mcp_types.ReadResourceRequest(
+            method="resources/read",
+            params=mcp_types.ReadResourceRequestParams(uri="batch://queue/status"),
+        )
+        result = await handler(request)
+        status = json.loads(result.root.contents[0].text)
+        assert "can_resume" in status
+
+    async def test_read_unknown_scheme_raises(self, server: Server) -> None:
+        handler = server.request_handlers[mcp_types.ReadResourceRequest]
+        request = mcp_types.ReadResourceRequest(
+            method="resources/read",
+            params=mcp_types.ReadResourceRequestParams(uri="unknown://thing"),
+        )
+        with pytest.raises(ValueError, match="Unknown resource URI"):
+            await handler(request)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -81,6 +82,65 @@ class TestRegisterTools:
         server.list_tools.assert_called_once()
         server.call_tool.assert_called_once()
 
+    def test_special_handlers_cover_special_tools(self) -> None:
+        from tools.register_tools import _SPECIAL_HANDLERS
+        from tools.tool_registry import SPECIAL_TOOLS
+
+        assert set(_SPECIAL_HANDLERS) == SPECIAL_TOOLS
+
+    def test_tool_definitions_built_once(self) -> None:
+        from tools import register_tools as mod
+
+        mod._tool_definitions.cache_clear()
+        mod._routes.cache_clear()
+        with patch.object(mod, "get_tool_definitions", wraps=mod.get_tool_definitions) as build:
+            mod.register_tools(MagicMock())
+            mod.register_tools(MagicMock())
+        build.assert_called_once()
+
+    def test_routes_cover_every_defined_tool(self) -> None:
+        from tools.register_tools import _SPECIAL_HANDLERS, _routes, _tool_definitions
+        from tools.tool_registry import TOOL_NAME_TO_BRIDGE
+
+        routes = _routes()
+        assert set(routes) == {tool.name for tool in _tool_definitions()}
+        for name, (handler, bridge_name, validator) in routes.items():
+            assert handler is _SPECIAL_HANDLERS.get(name)
+            assert bridge_name == TOOL_NAME_TO_BRIDGE.get(name)
+            assert validator.schema is next(
+                tool.inputSchema for tool in _tool_definitions() if tool.name == name
+            )
+
+    def test_mcp_input_validation_disabled(self) -> None:
+        from tools.register_tools import register_tools
+
+        server = MagicMock()
+        register_tools(server)
+        server.call_tool.assert_called_once_with(validate_input=False)
+
+    async def test_invalid_arguments_rejected_before_dispatch(self) -> None:
+        import mcp.types as types
+        from mcp.server import Server
+
+        from tools.register_tools import register_tools
+
+        server = Server("test")
+        register_tools(server)
+        handler = server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(
+                name="unity_compilation_await", arguments={"operation": "nope"}
+            ),
+        )
+
+        with patch("tools.register_tools.bridge_manager") as mock_bm:
+            result = await handler(request)
+
+        assert result.root.isError
+        assert result.root.content[0].text.startswith("Input validation error: 'nope'")
+        mock_bm.send_command.assert_not_called()
+
     async def test_call_tool_unknown_raises(self) -> None:
         from tools.register_tools import register_tools
 
@@ -155,6 +215,161 @@ class TestRegisterTools:
             )
 
 
+class TestAssetCrud:
+    """Tests for the unity_asset_crud tool."""
+
+    async def test_cs_create_merges_compilation_result(self) -> None:
+        import json
+
+        from tools.register_tools import _handle_asset_crud
+
+        with patch("tools.register_tools.bridge_manager") as mock_bm, \
+             patch("tools.register_tools.notify_tool_result"):
+            mock_bm.is_connected.return_value = True
+            mock_bm.send_command = AsyncMock(return_value={"success": True, "path": "A.cs"})
+            mock_bm.await_compilation = AsyncMock(return_value={"success": True, "errorCount": 0})
+            result = await _handle_asset_crud(
+                {"operation": "create", "assetPath": "Assets/A.cs", "content": ""}
+            )
+
+        data = json.loads(result[0].text)
+        assert data["path"] == "A.cs"
+        assert data["compilation"] == {"success": True, "errorCount": 0}
+
+    async def test_non_dict_response_gets_compilation_appended(self) -> None:
+        from tools.register_tools import _handle_asset_crud
+
+        with patch("tools.register_tools.bridge_manager") as mock_bm, \
+             patch("tools.register_tools.notify_tool_result"):
+            mock_bm.is_connected.return_value = True
+            mock_bm.send_command = AsyncMock(return_value="created")
+            mock_bm.await_compilation = AsyncMock(return_value={"success": True})
+            result = await _handle_asset_crud({"operation": "delete", "assetPath": "Assets/B.cs"})
+
+        assert result[0].text.startswith("created\n\nCompilation: ")
+
+    async def test_compilation_waiter_registered_before_crud_is_sent(self) -> None:
+        from tools.register_tools import _handle_asset_crud
+
+        order: list[str] = []
+
+        async def fake_await(timeout_seconds: int) -> dict:
+            order.append("await_compilation")
+            return {"success": True}
+
+        async def fake_send(*_args, **_kwargs) -> dict:
+            await asyncio.sleep(0)
+            order.append("send_command")
+            return {"success": True}
+
+        with patch("tools.register_tools.bridge_manager") as mock_bm, \
+             patch("tools.register_tools.notify_tool_result"):
+            mock_bm.is_connected.return_value = True
+            mock_bm.send_command = AsyncMock(side_effect=fake_send)
+            mock_bm.await_compilation = AsyncMock(side_effect=fake_await)
+            await _handle_asset_crud({"operation": "update", "assetPath": "Assets/C.cs"})
+
+        assert order == ["await_compilation", "send_command"]
+
+    async def test_crud_failure_cancels_compilation_wait(self) -> None:
+        from tools.register_tools import _handle_asset_crud
+
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fake_await(timeout_seconds: int) -> dict:
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return {}
+
+        async def fake_send(*_args, **_kwargs) -> dict:
+            await started.wait()
+            raise RuntimeError("boom")
+
+        with patch("tools.register_tools.bridge_manager") as mock_bm, \
+             patch("tools.register_tools.notify_tool_result"):
+            mock_bm.is_connected.return_value = True
+            mock_bm.send_command = AsyncMock(side_effect=fake_send)
+            mock_bm.await_compilation = AsyncMock(side_effect=fake_await)
+            with pytest.raises(RuntimeError, match="boom"):
+                await _handle_asset_crud({"operation": "create", "assetPath": "Assets/D.cs"})
+            await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+
+
+class TestCompilationAwait:
+    """Tests for the unity_compilation_await tool."""
+
+    @staticmethod
+    def _call_handler():
+        from tools.register_tools import register_tools
+
+        server = MagicMock()
+        handlers = {}
+        server.call_tool = lambda: lambda func: handlers.setdefault("call", func)
+        server.list_tools = lambda: lambda f: f
+        register_tools(server)
+        return handlers["call"]
+
+    async def test_status_polls_back_off(self) -> None:
+        from tools import register_tools as mod
+
+        call_handler = self._call_handler()
+        delays: list[float] = []
+
+        async def fake_wait(timeout: float) -> bool:
+            delays.append(timeout)
+            return False
+
+        with patch("tools.register_tools.bridge_manager") as mock_bm, \
+             patch("tools.register_tools.notify_tool_result"):
+            mock_bm.wait_for_compilation_start = AsyncMock(side_effect=fake_wait)
+            mock_bm.is_connected.return_value = True
+            mock_bm.is_compiling.return_value = False
+            mock_bm.send_command = AsyncMock(
+                side_effect=[{"isCompiling": False}] * 3 + [{"isCompiling": True}]
+            )
+            mock_bm.await_compilation = AsyncMock(return_value={"success": True})
+            result = await call_handler("unity_compilation_await", {"operation": "await"})
+
+        assert '"wasCompiling": true' in result[0].text
+        assert delays == pytest.approx(
+            [
+                mod.COMPILE_POLL_INITIAL_SECONDS,
+                mod.COMPILE_POLL_INITIAL_SECONDS * mod.COMPILE_POLL_BACKOFF,
+                mod.COMPILE_POLL_INITIAL_SECONDS * mod.COMPILE_POLL_BACKOFF**2,
+            ]
+        )
+
+    async def test_start_signal_at_deadline_is_not_missed(self) -> None:
+        call_handler = self._call_handler()
+        clock = iter([0.0, 0.0])
+
+        async def fake_wait(timeout: float) -> bool:
+            # compilation:started arrives just as the poll window runs out.
+            mock_bm.is_compiling.return_value = True
+            return True
+
+        with patch("tools.register_tools.bridge_manager") as mock_bm, \
+             patch("tools.register_tools.notify_tool_result"), \
+             patch("tools.register_tools.time") as mock_time:
+            mock_time.monotonic.side_effect = lambda: next(clock, 10.0)
+            mock_bm.wait_for_compilation_start = AsyncMock(side_effect=fake_wait)
+            mock_bm.is_connected.return_value = True
+            mock_bm.is_compiling.return_value = False
+            mock_bm.send_command = AsyncMock(return_value={"isCompiling": False})
+            mock_bm.await_compilation = AsyncMock(return_value={"success": True})
+            result = await call_handler("unity_compilation_await", {"operation": "await"})
+
+        assert '"wasCompiling": true' in result[0].text
+        mock_bm.await_compilation.assert_awaited_once()
+
+
 class TestReturnWithNotification:
     """Tests for _return_with_notification helper."""
 
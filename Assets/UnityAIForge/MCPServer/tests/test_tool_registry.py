@@ -63,6 +63,14 @@ class TestBridgeToToolName:
         for mcp_name, bridge_name in TOOL_NAME_TO_BRIDGE.items():
             assert BRIDGE_TO_TOOL_NAME[bridge_name] == mcp_name
 
+    def test_mappings_are_read_only(self) -> None:
+        from tools.tool_registry import BRIDGE_TO_TOOL_NAME, TOOL_NAME_TO_BRIDGE
+
+        with pytest.raises(TypeError):
+            TOOL_NAME_TO_BRIDGE["unity_new_tool"] = "newTool"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            BRIDGE_TO_TOOL_NAME["newTool"] = "unity_new_tool"  # type: ignore[index]
+
 
 class TestSpecialTools:
     """Tests for SPECIAL_TOOLS set."""
@@ -108,6 +116,19 @@ class TestResolveToolName:
         with pytest.raises(ValueError, match="Unsupported tool name"):
             resolve_tool_name("nonexistent_tool")
 
+    def test_resolve_caches_successful_lookups(self) -> None:
+        from tools.tool_registry import resolve_tool_name
+
+        resolve_tool_name.cache_clear()
+        resolve_tool_name("unity_scene_crud")
+        resolve_tool_name("unity_scene_crud")
+        with pytest.raises(ValueError):
+            resolve_tool_name("nonexistent_tool")
+
+        info = resolve_tool_name.cache_info()
+        assert info.hits == 1
+        assert info.currsize == 1
+
     def test_resolve_all_mcp_names(self) -> None:
         from tools.tool_registry import TOOL_NAME_TO_BRIDGE, resolve_tool_name
 
@@ -119,3 +140,19 @@ class TestResolveToolName:
 
         for bridge_name in TOOL_NAME_TO_BRIDGE.values():
             assert resolve_tool_name(bridge_name) == bridge_name
+
+
+class TestCsScriptSuffixes:
+    """Tests for CS_SCRIPT_SUFFIXES."""
+
+    def test_matches_any_casing(self) -> None:
+        from tools.tool_registry import CS_SCRIPT_SUFFIXES
+
+        for path in ("A.cs", "A.CS", "A.Cs", "A.cS"):
+            assert path.endswith(CS_SCRIPT_SUFFIXES)
+
+    def test_rejects_other_extensions(self) -> None:
+        from tools.tool_registry import CS_SCRIPT_SUFFIXES
+
+        for path in ("A.css", "A.csv", "A.shader", "cs"):
+            assert not path.endswith(CS_SCRIPT_SUFFIXES)